@@ -0,0 +1,103 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from fractions import Fraction
+from math import gcd
+from typing import Iterable, List, Tuple
+
+from tools import FRACTION
+
+
+def to_integer_row(values: Iterable) -> List[int]:
+    """
+    Scale a row of exact rationals by the lcm of their denominators.
+
+    >>> to_integer_row([Fraction(1, 2), Fraction(2, 3), 4])
+    [3, 4, 24]
+    """
+    values = [FRACTION.convert(x) for x in values]
+    multiple = 1
+    for x in values:
+        multiple = multiple * x.denominator // gcd(multiple, x.denominator)
+    return [int(x * multiple) for x in values]
+
+
+class ExactEchelonForm:
+    """
+    Row echelon form of an augmented matrix computed with fraction-free
+    Bareiss elimination. All entries stay integers and every division is
+    exact, so intermediate numbers only grow as fast as the minors of the
+    matrix, and zero tests involve no tolerance.
+
+    >>> e = ExactEchelonForm([[1, 1, 1, 1], [1, 1, 1, 2]])
+    >>> e.rank, e.is_consistent
+    (1, False)
+    >>> e = ExactEchelonForm([[0, 1, 1, 1], [1, -1, 1, 2], [1, 2, -5, 3]])
+    >>> e.rows
+    [[1, -1, 1, 2], [0, 1, 1, 1], [0, 0, -9, -2]]
+    >>> e.rank, e.pivot_columns
+    (3, [0, 1, 2])
+    """
+
+    def __init__(self, rows: Iterable[Iterable]):
+        self.rows = [to_integer_row(row) for row in rows]
+        self.dimension = len(self.rows[0]) - 1
+        self.pivot_columns: List[int] = []
+
+        self._eliminate()
+
+        self.rank = len(self.pivot_columns)
+        self.is_consistent = not any(row[-1] for row in self.rows[self.rank:])
+
+    def _eliminate(self):
+        rows = self.rows
+        width = self.dimension + 1
+        previous_pivot = 1
+        r = 0
+
+        for c in range(self.dimension):
+            for p in range(r, len(rows)):
+                if rows[p][c]:
+                    break
+            else:
+                continue
+
+            rows[r], rows[p] = rows[p], rows[r]
+            pivot_row = rows[r]
+            pivot = pivot_row[c]
+
+            for i in range(r + 1, len(rows)):
+                row = rows[i]
+                factor = row[c]
+                for j in range(c + 1, width):
+                    row[j] = (pivot * row[j] - factor * pivot_row[j]) \
+                        // previous_pivot
+                row[c] = 0
+
+            previous_pivot = pivot
+            self.pivot_columns.append(c)
+            r += 1
+
+    def reduced_rows(self) -> List[Tuple[List[Fraction], Fraction]]:
+        """
+        Nonzero rows of the reduced row echelon form as
+        ``(coefficients, constant_term)`` pairs of ``Fraction``.
+
+        >>> ExactEchelonForm([[2, 4, 2], [1, 3, 2]]).reduced_rows()
+        [([Fraction(1, 1), Fraction(0, 1)], Fraction(-1, 1)), \
+([Fraction(0, 1), Fraction(1, 1)], Fraction(1, 1))]
+        """
+        reduced = [[Fraction(x) for x in row] for row in self.rows[:self.rank]]
+
+        for k in reversed(range(self.rank)):
+            c = self.pivot_columns[k]
+            row = reduced[k]
+            pivot = row[c]
+            reduced[k] = row = [x / pivot for x in row]
+
+            for above in reduced[:k]:
+                factor = above[c]
+                if factor:
+                    for j in range(c, self.dimension + 1):
+                        above[j] -= factor * row[j]
+
+        return [(row[:-1], row[-1]) for row in reduced]
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from decimal import getcontext
+from itertools import islice
+from typing import Iterable, Iterator, List, Union
+
+from hyperplane import Hyperplane
+from linesys import LinearSystem, Parametrization
+from tools import FLOAT, get_backend
+from vector import Vector
+
+
+class SolveException(Exception):
+    """"""
+
+
+Solution = Union[Vector, Parametrization, None, SolveException]
+
+
+def _encode_values(values, backend) -> tuple:
+    if backend is FLOAT:
+        return tuple(values)
+    return tuple(str(x) for x in values)
+
+
+def encode_system(system: LinearSystem) -> tuple:
+    """
+    Compact picklable form of a system: backend name, dimension and the
+    augmented rows flattened into one tuple. Decimal and Fraction values
+    travel as strings, so nothing is lost on the way.
+
+    >>> from plane import Plane
+    >>> encode_system(LinearSystem(Plane(Vector(1, 2, 3), '0.5')))
+    ('decimal', 3, ('1', '2', '3', '0.5'))
+    """
+    values = []
+    for p in system:
+        values.extend(p.normal_vector)
+        values.append(p.constant_term)
+    return (system.backend.name, system.dimension,
+            _encode_values(values, system.backend))
+
+
+def decode_system(data: tuple) -> LinearSystem:
+    """
+    >>> decode_system(('float', 2, (1.0, 2.0, 3.0)))[0]
+    Hyperplane(Vector(1.0, 2.0), 3.0)
+    """
+    backend_name, dimension, values = data
+    backend = get_backend(backend_name)
+    width = dimension + 1
+    planes = [Hyperplane(Vector(*values[i:i + dimension], backend=backend),
+                         values[i + dimension])
+              for i in range(0, len(values), width)]
+    return LinearSystem(*planes, backend=backend)
+
+
+def encode_solution(solution: Solution):
+    if solution is None:
+        return None
+
+    if isinstance(solution, SolveException):
+        return 'e', str(solution)
+
+    if isinstance(solution, Vector):
+        return 'v', _encode_values(solution, solution.backend)
+
+    backend = solution.basepoint.backend
+    return ('p', _encode_values(solution.basepoint, backend),
+            [_encode_values(v, backend) for v in solution.direction_vectors])
+
+
+def decode_solution(data, backend) -> Solution:
+    """
+    >>> from tools import DECIMAL
+    >>> decode_solution(encode_solution(Vector(1, '0.5')), DECIMAL)
+    Vector(1, 0.5)
+    >>> decode_solution(('e', 'InvalidOperation'), DECIMAL)
+    SolveException('InvalidOperation')
+    """
+    if data is None:
+        return None
+
+    if data[0] == 'v':
+        return Vector(*data[1], backend=backend)
+    if data[0] == 'e':
+        return SolveException(data[1])
+
+    _, basepoint, directions = data
+    return Parametrization(Vector(*basepoint, backend=backend),
+                           [Vector(*v, backend=backend) for v in directions])
+
+
+def init_worker(precision: int):
+    # Worker processes must not rely on the import time side effect of
+    # ``vector`` for the Decimal precision the parent process runs with
+    getcontext().prec = precision
+
+
+def _solve_one(data: tuple):
+    try:
+        return encode_solution(decode_system(data).solve())
+    except Exception as e:
+        # One bad system must not take the rest of its chunk down with it
+        return 'e', str(e) or e.__class__.__name__
+
+
+def _solve_chunk(chunk: List[tuple]) -> list:
+    return [_solve_one(data) for data in chunk]
+
+
+class BatchSolver:
+    """
+    Solve many independent systems across a pool of worker processes.
+
+    Systems are sent in chunks of ``chunksize`` in their compact encoded
+    form and at most ``2 * workers`` chunks are in flight, so memory stays
+    bounded for arbitrarily long inputs. Results come back in input order.
+    A system whose solve raises yields a ``SolveException`` in its place,
+    and ``SolveException`` items of ``systems`` are passed through as they
+    are.
+    ``workers`` defaults to one per CPU; with ``workers=0`` everything runs
+    in the calling process.
+
+    >>> from plane import Plane
+    >>> systems = [LinearSystem(Plane(Vector(1, 0, 0), i),
+    ...                         Plane(Vector(0, 1, 0), 2),
+    ...                         Plane(Vector(0, 0, 1), 3)) for i in range(5)]
+    >>> with BatchSolver(workers=2, chunksize=2) as solver:
+    ...     solver.solve(systems)
+    [Vector(0, 2, 3), Vector(1, 2, 3), Vector(2, 2, 3), Vector(3, 2, 3), \
+Vector(4, 2, 3)]
+    """
+
+    def __init__(self, workers: int = None, chunksize: int = 256):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.workers = workers
+        self.chunksize = chunksize
+        self.executor = None
+
+        if workers != 0:
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=init_worker,
+                initargs=(getcontext().prec,))
+
+    def solve(self, systems: Iterable[Union[LinearSystem, SolveException]]) \
+            -> List[Solution]:
+        return list(self.solve_iter(systems))
+
+    def solve_iter(self,
+                   systems: Iterable[Union[LinearSystem, SolveException]]) \
+            -> Iterator[Solution]:
+        systems = iter(systems)
+        window = 2 * max(self.workers, 1)
+        pending = deque()
+
+        while True:
+            while len(pending) < window:
+                chunk = list(islice(systems, self.chunksize))
+                if not chunk:
+                    break
+                # Failures known in advance keep their place in the chunk
+                # but never reach a worker
+                entries = [s if isinstance(s, SolveException) else s.backend
+                           for s in chunk]
+                encoded = [encode_system(s) for s in chunk
+                           if not isinstance(s, SolveException)]
+                if self.executor is None or not encoded:
+                    pending.append((entries, _solve_chunk(encoded)))
+                else:
+                    pending.append(
+                        (entries, self.executor.submit(_solve_chunk,
+                                                       encoded)))
+
+            if not pending:
+                return
+
+            entries, results = pending.popleft()
+            if not isinstance(results, list):
+                results = results.result()
+            results = iter(results)
+            for entry in entries:
+                if isinstance(entry, SolveException):
+                    yield entry
+                else:
+                    yield decode_solution(next(results), entry)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def solve_many(systems: Iterable[LinearSystem], workers: int = None,
+               chunksize: int = 256) -> List[Solution]:
+    """
+    Solve ``systems`` on a temporary process pool, in input order.
+    """
+    with BatchSolver(workers=workers, chunksize=chunksize) as solver:
+        return solver.solve(systems)
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+"""
+Timing of the hot paths at growing sizes.
+
+    python benchmarks.py --output bench.json
+    python benchmarks.py --baseline bench.json --threshold 0.2
+
+Every result is the best time of one call, in seconds, keyed as
+``name[size]``. With ``--baseline`` the run is compared against an earlier
+output file, and the exit code is 1 when any case got slower than the
+threshold allows.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+from typing import Callable, Dict, List
+
+BENCHMARKS: List[tuple] = []
+
+
+def benchmark(name: str, sizes: List[int], quick_sizes: List[int] = None):
+    """
+    Register ``setup(size)``, which builds the inputs and returns the
+    callable to time.
+    """
+    def decorator(setup: Callable[[int], Callable]):
+        BENCHMARKS.append((name, sizes, quick_sizes or sizes[:2], setup))
+        return setup
+    return decorator
+
+
+def _random_system(size: int, backend: str):
+    from hyperplane import Hyperplane
+    from linesys import LinearSystem
+    from vector import Vector
+
+    rows = [[random.uniform(-10, 10) for _ in range(size + 1)]
+            for _ in range(size)]
+    for i, row in enumerate(rows):
+        row[i] += 10 * size
+    return LinearSystem(*[Hyperplane(Vector(*row[:-1], backend=backend),
+                                     row[-1]) for row in rows])
+
+
+@benchmark('vector_add', [3, 30, 300, 3000])
+def _vector_add(size):
+    from vector import Vector
+    a = Vector(*range(size))
+    b = Vector(*range(size, 0, -1))
+    return lambda: a + b
+
+
+@benchmark('vector_dot', [3, 30, 300, 3000])
+def _vector_dot(size):
+    from vector import Vector
+    a = Vector(*range(size))
+    b = Vector(*range(size, 0, -1))
+    return lambda: a * b
+
+
+@benchmark('vector_angle', [3, 30, 300])
+def _vector_angle(size):
+    from vector import Vector
+    a = Vector(*range(1, size + 1))
+    b = Vector(*range(size, 0, -1))
+    return lambda: Vector(*a).angle_to(Vector(*b))
+
+
+@benchmark('vector_array_add', [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6])
+def _vector_array_add(size):
+    import numpy as np
+    from vector_array import VectorArray
+    a = VectorArray(np.random.rand(size, 3))
+    b = VectorArray(np.random.rand(size, 3))
+    return lambda: a + b
+
+
+@benchmark('line_intersection', [1])
+def _line_intersection(size):
+    from line import Line
+    from vector import Vector
+    a = Line(Vector('7.204', '3.182'), '8.68')
+    b = Line(Vector('8.172', '4.114'), '9.883')
+    return lambda: a.get_intersection(b)
+
+
+@benchmark('line_array_intersect', [10 ** 3, 10 ** 5, 10 ** 6])
+def _line_array_intersect(size):
+    import numpy as np
+    from line import Line
+    from line_array import LineArray
+    from vector import Vector
+    lines = LineArray(np.random.rand(size, 2), np.random.rand(size))
+    query = Line(Vector('7.204', '3.182'), '8.68')
+    return lambda: lines.intersect(query)
+
+
+@benchmark('plane_add_mul', [1])
+def _plane_add_mul(size):
+    from plane import Plane
+    from vector import Vector
+    a = Plane(Vector(1, 2, 3), 4)
+    b = Plane(Vector(-4, 2, 7), 1)
+    return lambda: a + b * 3
+
+
+@benchmark('rref_decimal', [3, 10, 30, 100], [3, 10])
+def _rref_decimal(size):
+    system = _random_system(size, 'decimal')
+    return system.compute_rref
+
+
+@benchmark('solve_decimal', [3, 10, 30, 100], [3, 10])
+def _solve_decimal(size):
+    system = _random_system(size, 'decimal')
+    return system.solve
+
+
+@benchmark('solve_float', [3, 10, 100, 300, 1000], [3, 10])
+def _solve_float(size):
+    system = _random_system(size, 'float')
+    return system.solve
+
+
+def run(quick: bool = False, pattern: str = None,
+        min_time: float = 0.2) -> Dict[str, float]:
+    random.seed(0)
+    results = {}
+    for name, sizes, quick_sizes, setup in BENCHMARKS:
+        if pattern and pattern not in name:
+            continue
+        for size in (quick_sizes if quick else sizes):
+            function = setup(size)
+            timer = timeit.Timer(function)
+            number, elapsed = timer.autorange()
+            repeat = max(3, min(10, int(min_time / max(elapsed, 1e-9))))
+            best = min(timer.repeat(repeat=repeat, number=number)) / number
+            key = f'{name}[{size}]'
+            results[key] = best
+            print(f'{key:<36s}{best * 1e6:>16.2f} us', file=sys.stderr)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float) -> List[str]:
+    """
+    Names of the cases that are slower than ``baseline`` by more than
+    ``threshold`` (0.2 means 20%).
+
+    >>> compare({'a[1]': 1.3, 'b[1]': 1.0}, {'a[1]': 1.0, 'b[1]': 1.0}, 0.2)
+    ['a[1]']
+    """
+    return [key for key, value in sorted(results.items())
+            if key in baseline and value > baseline[key] * (1 + threshold)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--output', help='write results as JSON here')
+    parser.add_argument('--baseline', help='JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed slowdown against the baseline')
+    parser.add_argument('--quick', action='store_true',
+                        help='only run the smallest sizes')
+    parser.add_argument('--filter', help='only run benchmarks matching this')
+    args = parser.parse_args(argv)
+
+    results = run(quick=args.quick, pattern=args.filter)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'python': platform.python_version(),
+                       'machine': platform.machine(),
+                       'results': results}, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+
+        print(f"{'case':<36s}{'baseline':>12s}{'current':>12s}{'change':>9s}")
+        for key in sorted(results):
+            if key not in baseline:
+                continue
+            change = results[key] / baseline[key] - 1
+            print(f'{key:<36s}{baseline[key] * 1e6:>12.2f}'
+                  f'{results[key] * 1e6:>12.2f}{change:>+9.1%}')
+
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
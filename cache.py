@@ -0,0 +1,66 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from typing import Hashable
+
+
+class LRUCache:
+    """
+    Mapping of at most ``maxsize`` entries that evicts the least recently
+    used one, with hit and miss counters.
+
+    >>> cache = LRUCache(2)
+    >>> cache.put('a', 1)
+    >>> cache.put('b', 2)
+    >>> cache.get('a')
+    1
+    >>> cache.put('c', 3)
+    >>> print(cache.get('b'))
+    None
+    >>> cache.stats()
+    {'hits': 1, 'misses': 1, 'evictions': 1, 'size': 2, 'maxsize': 2}
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        assert maxsize > 0, 'LRUCache needs room for at least one entry'
+
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default=None):
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'size': len(self.entries),
+                'maxsize': self.maxsize}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __str__(self):
+        return f"{self.__class__.__name__}({self.stats()})"
+
+    __repr__ = __str__
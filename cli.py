@@ -0,0 +1,212 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+"""
+Solve a stream of linear systems, one per record.
+
+    python cli.py systems.jsonl --workers 4 > solutions.jsonl
+    python cli.py --format csv < systems.csv
+
+JSON Lines input has one object per line, ``{"id": ..., "equations":
+[[a_0, ..., a_n-1, c], ...], "backend": ...}``; ``id`` defaults to the line
+number and ``backend`` to ``--backend``. CSV input has one equation per
+row, ``id, a_0, ..., a_n-1, c``; consecutive rows with the same id form
+one system and a first row starting with ``id`` is a header.
+
+Every system yields one JSON line, in input order: ``status`` is
+``unique`` (with ``solution``), ``infinite`` (with ``basepoint``,
+``free_variables`` and their ``directions``), ``none`` or ``error``.
+Decimal and Fraction values are written as strings, so nothing is lost.
+
+>>> import io
+>>> out = io.StringIO()
+>>> main(['--format', 'csv'], io.StringIO('''id,x,y,c
+... a,1,0,2
+... a,0,1,3
+... b,1,1,1
+... b,2,2,2
+... c,1,1
+... c,1,1,2
+... '''), out)
+0
+>>> print(out.getvalue(), end='')
+{"id": "a", "status": "unique", "solution": ["2", "3"]}
+{"id": "b", "status": "infinite", "basepoint": ["1", "0"], \
+"free_variables": [1], "directions": [["-1", "1"]]}
+{"id": "c", "status": "error", "error": "All equations should have \
+the same number of coefficients"}
+"""
+import argparse
+import csv
+import json
+import sys
+from collections import deque
+from decimal import Decimal
+from itertools import groupby
+from typing import Iterable, Iterator, List, TextIO, Tuple
+
+# Solver modules pull in numpy, so they are imported only once there is
+# input to solve
+
+INPUT_ERRORS = (ValueError, TypeError, KeyError, IndexError, AssertionError,
+                ArithmeticError)
+
+
+def build_system(rows: List[list], backend: str):
+    from hyperplane import Hyperplane
+    from linesys import LinearSystem
+    from vector import Vector
+
+    if not rows or any(len(row) != len(rows[0]) for row in rows):
+        raise ValueError(
+            'All equations should have the same number of coefficients')
+    if len(rows[0]) < 2:
+        raise ValueError('An equation needs coefficients and a constant')
+    return LinearSystem(*[Hyperplane(Vector(*row[:-1], backend=backend),
+                                     row[-1]) for row in rows])
+
+
+def read_jsonl(stream: TextIO, backend: str) -> Iterator[Tuple]:
+    """
+    ``(id, system, error)`` for every non-empty line of ``stream``.
+    """
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        record_id = number
+        try:
+            record = json.loads(line, parse_float=Decimal)
+            if isinstance(record, dict):
+                record_id = record.get('id', number)
+                rows = record['equations']
+                record_backend = record.get('backend', backend)
+            else:
+                rows, record_backend = record, backend
+            yield record_id, build_system(rows, record_backend), None
+        except INPUT_ERRORS as e:
+            yield record_id, None, str(e) or e.__class__.__name__
+
+
+def read_csv(stream: TextIO, backend: str) -> Iterator[Tuple]:
+    """
+    ``(id, system, error)`` for every run of rows sharing an id.
+    """
+    rows = (row for row in csv.reader(stream) if row)
+    first = next(rows, None)
+    if first is None:
+        return
+    if first[0].strip().lower() != 'id':
+        rows = _prepend(first, rows)
+
+    for record_id, group in groupby(rows, key=lambda row: row[0]):
+        try:
+            equations = [[x.strip() for x in row[1:]] for row in group]
+            yield record_id, build_system(equations, backend), None
+        except INPUT_ERRORS as e:
+            yield record_id, None, str(e) or e.__class__.__name__
+
+
+def _prepend(first, rows):
+    yield first
+    yield from rows
+
+
+def vector_values(vector) -> list:
+    from tools import FLOAT
+    if vector.backend is FLOAT:
+        return list(vector)
+    return [str(x) for x in vector]
+
+
+def format_solution(record_id, solution) -> dict:
+    from vector import Vector
+
+    if solution is None:
+        return {'id': record_id, 'status': 'none'}
+    if isinstance(solution, Vector):
+        return {'id': record_id, 'status': 'unique',
+                'solution': vector_values(solution)}
+
+    free = [(i, v) for i, v in enumerate(solution.direction_vectors) if v]
+    return {'id': record_id, 'status': 'infinite',
+            'basepoint': vector_values(solution.basepoint),
+            'free_variables': [i for i, _ in free],
+            'directions': [vector_values(v) for _, v in free]}
+
+
+def solve_records(records: Iterable[Tuple], workers: int = 0,
+                  chunksize: int = 256) -> Iterator[dict]:
+    """
+    Output objects for ``records`` in input order. Invalid records travel
+    through the solver's read-ahead window as ``SolveException`` markers,
+    so they are written as soon as their turn comes and memory stays
+    bounded however many of them are in a row. A system that fails to
+    solve only turns its own record into an error.
+
+    >>> from hyperplane import Hyperplane
+    >>> from linesys import LinearSystem
+    >>> from vector import Vector
+    >>> records = [(1, build_system([[1, 0, 1]], 'decimal'), None),
+    ...            (2, LinearSystem(Hyperplane(Vector('Infinity', 1), 1),
+    ...                             Hyperplane(Vector(1, 1), 2)), None),
+    ...            (3, None, 'Bad record')]
+    >>> for result in solve_records(records):
+    ...     print(result['id'], result['status'], result.get('directions'))
+    1 infinite [['0', '1']]
+    2 error None
+    3 error None
+    """
+    from batch import BatchSolver, SolveException
+
+    record_ids = deque()
+
+    def systems():
+        for record_id, system, error in records:
+            record_ids.append(record_id)
+            yield system if error is None else SolveException(error)
+
+    with BatchSolver(workers=workers, chunksize=chunksize) as solver:
+        for solution in solver.solve_iter(systems()):
+            record_id = record_ids.popleft()
+            if isinstance(solution, SolveException):
+                yield {'id': record_id, 'status': 'error',
+                       'error': str(solution)}
+            else:
+                yield format_solution(record_id, solution)
+
+
+def main(argv=None, stdin: TextIO = None, stdout: TextIO = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('input', nargs='?',
+                        help='input file, standard input when omitted')
+    parser.add_argument('--format', choices=('jsonl', 'csv'),
+                        help='input format, guessed from the file name')
+    parser.add_argument('--backend', default='decimal',
+                        choices=('decimal', 'float', 'fraction'))
+    parser.add_argument('--workers', type=int, default=0,
+                        help='worker processes, 0 solves in this process')
+    parser.add_argument('--chunksize', type=int, default=256,
+                        help='systems sent to a worker at once')
+    args = parser.parse_args(argv)
+
+    stdout = stdout or sys.stdout
+    input_format = args.format
+    if input_format is None:
+        is_csv = args.input is not None and args.input.endswith('.csv')
+        input_format = 'csv' if is_csv else 'jsonl'
+
+    stream = open(args.input, newline='') if args.input else \
+        (stdin or sys.stdin)
+    try:
+        read = read_csv if input_format == 'csv' else read_jsonl
+        records = read(stream, args.backend)
+        for result in solve_records(records, args.workers, args.chunksize):
+            stdout.write(json.dumps(result) + '\n')
+    finally:
+        if args.input:
+            stream.close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from decimal import Decimal
+from typing import Iterable, List, Union
+
+import instrumentation
+from tools import (KEY_DIGITS, NumericBackend, first_nonzero_index,
+                   get_backend, round_key)
+from vector import Vector
+
+
+class Hyperplane:
+    """
+    Set of points ``x`` with ``normal_vector * x = constant_term`` in a
+    space of any dimension. ``Line`` and ``Plane`` are its 2D and 3D cases.
+
+    >>> h = Hyperplane(Vector(1, 0, 2, 0, 1), 4)
+    >>> h.dimension
+    5
+    >>> h.base_point
+    Vector(4, 0, 0, 0, 0)
+    """
+
+    __slots__ = ('dimension', 'normal_vector', 'backend', 'constant_term',
+                 '_base_point')
+
+    def __init__(self,
+                 normal_vector: Vector,
+                 constant_term: Union[int, float, str, Decimal]):
+        self.dimension = normal_vector.dimension
+
+        self.normal_vector: Vector = normal_vector
+        self.backend = normal_vector.backend
+        self.constant_term = self.backend.convert(constant_term)
+
+        if instrumentation.ACTIVE is not None:
+            instrumentation.ACTIVE.count('hyperplanes')
+
+    @property
+    def base_point(self) -> Union[Vector, None]:
+        """
+        Point of the hyperplane on the axis of the first nonzero normal
+        coefficient, computed on first access.
+
+        >>> print(Hyperplane(Vector(0, 0), 1).base_point)
+        None
+        """
+        try:
+            return self._base_point
+        except AttributeError:
+            pass
+
+        base_point = None
+        initial_index = first_nonzero_index(self.normal_vector, self.backend)
+        if initial_index is not None:
+            base_point_coords = ['0'] * self.dimension
+            initial_coefficient = self.normal_vector[initial_index]
+            base_point_coords[initial_index] = \
+                self.constant_term / initial_coefficient
+            base_point = Vector(*base_point_coords, backend=self.backend)
+
+        self._base_point = base_point
+        return base_point
+
+    def to_backend(self, backend: Union[str, NumericBackend]) -> 'Hyperplane':
+        """
+        >>> Hyperplane(Vector(1, 2, 3, 4), '0.5').to_backend('float')
+        Hyperplane(Vector(1.0, 2.0, 3.0, 4.0), 0.5)
+        """
+        backend = get_backend(backend)
+        if backend is self.backend:
+            return self
+        return self.__class__(self.normal_vector.to_backend(backend),
+                              self.constant_term)
+
+    def is_parallel(self, other: 'Hyperplane') -> bool:
+        """
+        >>> Hyperplane(Vector(1, 2, 3, 4), 5).is_parallel(
+        ...     Hyperplane(Vector(2, 4, 6, 8), 3))
+        True
+        >>> Hyperplane(Vector(1, 2, 3, 4), 5).is_parallel(
+        ...     Hyperplane(Vector(2, 4, 6, 7), 3))
+        False
+        """
+        return self.normal_vector.is_parallel(other.normal_vector)
+
+    def __eq__(self, other: 'Hyperplane') -> bool:
+        """
+        >>> Hyperplane(Vector(1, 2, 3, 4), 5) == \\
+        ...     Hyperplane(Vector(2, 4, 6, 8), 10)
+        True
+        >>> Hyperplane(Vector(1, 2, 3, 4), 5) == \\
+        ...     Hyperplane(Vector(2, 4, 6, 8), 9)
+        False
+        >>> Hyperplane(Vector(0, 0), 0) == Hyperplane(Vector(0, 0), 0)
+        True
+        >>> Hyperplane(Vector(0, 0), 1) == Hyperplane(Vector(1, 0), 1)
+        False
+        """
+        if not self.normal_vector:
+            if other.normal_vector:
+                return False
+            else:
+                diff = self.constant_term - other.constant_term
+                return self.backend.is_zero(diff)
+        elif not other.normal_vector:
+            return False
+
+        if not self.is_parallel(other):
+            return False
+
+        middle_vector = self.base_point - other.base_point
+
+        return self.normal_vector.is_orthogonal(middle_vector)
+
+    def __hash__(self):
+        """
+        Hash of ``canonical_key()``, so every scaling of an equation lands
+        in the same bucket. ``__eq__`` is tolerant while the key is rounded:
+        equal hyperplanes whose canonical values straddle a rounding
+        boundary of the last kept digit hash differently, and a set may
+        then keep both of them.
+
+        >>> len({Hyperplane(Vector(2, 3), 5),
+        ...      Hyperplane(Vector(-4, -6), -10),
+        ...      Hyperplane(Vector(2, 3), 6)})
+        2
+        """
+        return hash(self.canonical_key())
+
+    def canonical(self) -> 'Hyperplane':
+        """
+        Equal hyperplane scaled so its first nonzero normal coefficient is 1.
+
+        >>> Hyperplane(Vector(0, -2, 4, 2), 6).canonical()
+        Hyperplane(Vector(0, 1, -2, -1), -3)
+        >>> Hyperplane(Vector(0, 0), 2).canonical()
+        Hyperplane(Vector(0, 0), 2)
+        """
+        initial_index = first_nonzero_index(self.normal_vector, self.backend)
+        if initial_index is None:
+            return self
+        initial_coefficient = self.normal_vector[initial_index]
+        return self.__class__(self.normal_vector / initial_coefficient,
+                              self.constant_term / initial_coefficient)
+
+    def canonical_row(self) -> tuple:
+        """
+        Exact coefficients and constant term of ``canonical()``, the same
+        for every exact scaling of the equation.
+
+        >>> Hyperplane(Vector(-3, -6), 9).canonical_row()
+        (Decimal('1'), Decimal('2'), Decimal('-3'))
+        """
+        canonical = self.canonical()
+        return tuple(canonical.normal_vector.coordinates) + \
+            (canonical.constant_term,)
+
+    def canonical_key(self, digits: int = KEY_DIGITS) -> tuple:
+        """
+        Rounded coefficients and constant term of ``canonical()``, the same
+        for every scaling of the equation.
+
+        >>> Hyperplane(Vector(3, 6), 9).canonical_key()
+        (1.0, 2.0, 3.0)
+        """
+        canonical = self.canonical()
+        return round_key(list(canonical.normal_vector) +
+                         [canonical.constant_term], digits)
+
+    def __add__(self, other: 'Hyperplane') -> 'Hyperplane':
+        """
+        >>> Hyperplane(Vector(1, 2, 3, 4), 4) + \\
+        ...     Hyperplane(Vector(2, 3, 1, 0), 2)
+        Hyperplane(Vector(3, 5, 4, 4), 6)
+        """
+        assert self.dimension == other.dimension
+        other = other.to_backend(self.backend)
+
+        return self.__class__(self.normal_vector + other.normal_vector,
+                              self.constant_term + other.constant_term)
+
+    def __mul__(self, other: Union[float, Decimal]) -> 'Hyperplane':
+        """
+        >>> Hyperplane(Vector(1, 2, 3, 4), 1) * -1
+        Hyperplane(Vector(-1, -2, -3, -4), -1)
+        """
+        other = self.backend.convert(other)
+        return self.__class__(self.normal_vector * other,
+                              self.constant_term * other)
+
+    def __str__(self):
+        class_name = self.__class__.__name__
+        return f"{class_name}({self.normal_vector}, {self.constant_term})"
+
+    __repr__ = __str__
+
+
+def unique_hyperplanes(planes: Iterable[Hyperplane]) -> List[Hyperplane]:
+    """
+    Drop equations that are scalings or near-duplicates of an earlier one,
+    keeping the first occurrence, in a single pass over ``planes``.
+
+    Candidates are grouped by ``canonical_key()`` and an equation is only
+    dropped when it also compares equal to a kept one, so equations that
+    ``__eq__`` tells apart survive and the solution set never changes.
+
+    >>> unique_hyperplanes([Hyperplane(Vector(1, 2), 3),
+    ...                     Hyperplane(Vector(2, 4), 6),
+    ...                     Hyperplane(Vector(1, 2), '3.00000000001'),
+    ...                     Hyperplane(Vector(1, 2), 4),
+    ...                     Hyperplane(Vector(1, 2), '3.0000000004')])
+    [Hyperplane(Vector(1, 2), 3), Hyperplane(Vector(1, 2), 4), \
+Hyperplane(Vector(1, 2), 3.0000000004)]
+    """
+    groups = {}
+    result = []
+    for plane in planes:
+        kept = groups.setdefault(plane.canonical_key(), [])
+        if not any(plane == other for other in kept):
+            kept.append(plane)
+            result.append(plane)
+    return result
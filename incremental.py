@@ -0,0 +1,126 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from typing import Iterable, List, Union
+
+import numpy as np
+
+from hyperplane import Hyperplane
+from linesys import LinearSystem, Parametrization
+from matrix import AugmentedMatrix
+from tools import NumericBackend, get_backend
+from vector import Vector
+
+
+class IncrementalLinearSystem:
+    """
+    Linear system that keeps its reduced row echelon form up to date while
+    equations are appended one at a time.
+
+    Each new equation is reduced against the current basis, and only when
+    it adds to the rank its pivot column is cleared from the other basis
+    rows, so an append costs O(rank * dimension) instead of a full
+    elimination.
+
+    >>> s = IncrementalLinearSystem(3)
+    >>> s.append(Hyperplane(Vector(1, 1, 1), 1))
+    >>> s.rank, s.is_consistent
+    (1, True)
+    >>> s.append(Hyperplane(Vector(2, 2, 2), 2))
+    >>> s.rank
+    1
+    >>> s.append(Hyperplane(Vector(0, 1, 0), 2))
+    >>> print(s.solve())
+    [x_0, x_1, x_2] = Vector(-1, 2, 0) + x_2 * Vector(-1, 0, 1)
+    >>> s.append(Hyperplane(Vector(0, 0, 1), 3))
+    >>> s.solve()
+    Vector(-4, 2, 3)
+    >>> s.append(Hyperplane(Vector(1, 0, 0), 0))
+    >>> s.rank, s.is_consistent
+    (3, False)
+    >>> print(s.solve())
+    None
+    """
+
+    def __init__(self, dimension: int,
+                 backend: Union[str, NumericBackend] = None):
+        self.dimension = dimension
+        self.backend = get_backend(backend)
+        self.equations = 0
+        self.is_consistent = True
+
+        # Rows of the echelon basis, preallocated because the rank never
+        # exceeds the dimension; ``pivots[k]`` is the pivot column of row k
+        self._basis = AugmentedMatrix(
+            [[0] * (dimension + 1) for _ in range(dimension)], self.backend)
+        self.pivots: List[int] = []
+
+    @property
+    def rank(self) -> int:
+        return len(self.pivots)
+
+    def append(self, plane: Hyperplane):
+        assert plane.dimension == self.dimension, \
+            'All planes in the system should live in the same dimension'
+
+        plane = plane.to_backend(self.backend)
+        self.equations += 1
+
+        basis = self._basis
+        rows = basis.rows
+        rank = self.rank
+
+        row = np.array(list(plane.normal_vector) + [plane.constant_term],
+                       dtype=rows.dtype)
+        if rank:
+            # Basis rows carry an identity on the pivot columns, so the
+            # whole reduction is a single vector-matrix product
+            row -= row[self.pivots] @ rows[:rank]
+            basis.snap(row)
+
+        nonzero = np.flatnonzero(~basis.zero_mask(row[:-1]))
+        if not len(nonzero):
+            if not self.backend.is_zero(row[-1]):
+                self.is_consistent = False
+            return
+
+        q = int(nonzero[0])
+        row /= row[q]
+        basis.snap(row)
+
+        if rank:
+            block = rows[:rank]
+            block -= np.outer(block[:, q], row)
+            basis.snap(block)
+
+        rows[rank] = row
+        self.pivots.append(q)
+
+    def extend(self, planes: Iterable[Hyperplane]):
+        for plane in planes:
+            self.append(plane)
+
+    def echelon_form(self) -> List[Hyperplane]:
+        """
+        Current basis rows ordered by pivot column.
+        """
+        order = sorted(range(self.rank), key=lambda k: self.pivots[k])
+        return [self._basis.row_to_plane(k, Hyperplane) for k in order]
+
+    def solve(self) -> Union[Vector, Parametrization, None]:
+        if not self.is_consistent:
+            return None
+
+        equations = self.echelon_form()
+        if self.rank == self.dimension:
+            return Vector(*(e.constant_term for e in equations),
+                          backend=self.backend)
+
+        # Any system of the right dimension and backend can build the
+        # parametrization out of reduced equations
+        system = LinearSystem(
+            Hyperplane(Vector(*[0] * self.dimension, backend=self.backend),
+                       0))
+        return system.build_parametrization(equations)
+
+    def __len__(self):
+        return self.equations
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+"""
+Opt-in counters, phase timers and pivot trace for elimination.
+
+Nothing is recorded unless a ``recording()`` block is active; the hooks in
+the hot paths reduce to a single ``ACTIVE is None`` check otherwise.
+
+>>> from linesys import LinearSystem
+>>> from plane import Plane
+>>> from vector import Vector
+>>> s = LinearSystem(Plane(Vector(0, 1, 1), 1),
+...                  Plane(Vector(1, -1, 1), 2),
+...                  Plane(Vector(1, 2, -5), 3))
+>>> with recording() as recorder:
+...     _ = s.solve()
+>>> recorder.counters['swap_rows'], recorder.counters['pivots']
+(1, 6)
+>>> sorted(recorder.timings)
+['rref', 'triangular']
+>>> recorder.pivots[0]
+('triangular', 0, 0, 1.0, False)
+>>> print(ACTIVE)
+None
+"""
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+ACTIVE: 'Recorder' = None
+
+
+class Recorder:
+    """
+    Collected statistics of one ``recording()`` block.
+
+    ``pivots`` holds ``(phase, row, column, value, near_zero)`` tuples, where
+    ``near_zero`` marks pivots that passed the backend zero test but are
+    smaller than ``near_zero``.
+    """
+
+    def __init__(self, near_zero: float = 1e-8):
+        self.near_zero = near_zero
+        self.counters: Dict[str, int] = Counter()
+        self.timings: Dict[str, float] = Counter()
+        self.pivots: List[Tuple[str, int, int, float, bool]] = []
+
+    def count(self, name: str, amount: int = 1):
+        self.counters[name] += amount
+
+    def pivot(self, phase: str, row: int, column: int, value):
+        value = float(value)
+        near_zero = abs(value) < self.near_zero
+        self.count('pivots')
+        if near_zero:
+            self.count('near_zero_pivots')
+        self.pivots.append((phase, row, column, value, near_zero))
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] += time.perf_counter() - start
+
+    def as_dict(self) -> dict:
+        """
+        Flat ``{metric: value}`` mapping for metrics exporters.
+
+        >>> r = Recorder()
+        >>> r.count('swap_rows', 2)
+        >>> r.as_dict()
+        {'count.swap_rows': 2}
+        """
+        metrics = {f'count.{k}': v for k, v in sorted(self.counters.items())}
+        metrics.update({f'seconds.{k}': v
+                        for k, v in sorted(self.timings.items())})
+        return metrics
+
+
+class _NullPhase:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def phase(name: str):
+    """
+    Time the enclosed block as ``name`` when recording, else do nothing.
+    """
+    if ACTIVE is None:
+        return _NULL_PHASE
+    return ACTIVE.phase(name)
+
+
+@contextmanager
+def recording(near_zero: float = 1e-8):
+    """
+    Record everything that runs inside the block into a new ``Recorder``.
+    """
+    global ACTIVE
+    previous = ACTIVE
+    ACTIVE = recorder = Recorder(near_zero)
+    try:
+        yield recorder
+    finally:
+        ACTIVE = previous
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from decimal import Decimal
+from fractions import Fraction
+from itertools import repeat
+from operator import add, mul, neg, sub, truediv
+from typing import Iterator, Union
+
+from vector import Vector
+
+SCALARS = (int, float, Decimal, Fraction)
+
+
+class LazyVector:
+    """
+    Deferred ``Vector`` arithmetic. Operators only record an expression
+    tree; ``evaluate()`` computes every coordinate in one fused pass of
+    chained iterators, so no intermediate ``Vector`` or tuple is built and
+    values are converted once at the leaves and once in the result.
+
+    Start an expression with ``Vector.lazy()``. A dot product (``*``
+    between two vectors) needs every coordinate, so it is computed right
+    away, still without temporaries.
+
+    Eager arithmetic snaps tiny values of every intermediate ``Vector`` to
+    zero, a fused expression only snaps the final result.
+
+    >>> a, b = Vector(1, 2, 3), Vector(3, 2, 1)
+    >>> a.lazy() * 2 - b
+    LazyVector((Vector(1, 2, 3) * 2) - Vector(3, 2, 1))
+    >>> e = (a.lazy() + b) * 2 - b.lazy() / 2
+    >>> e.evaluate()
+    Vector(6.5, 7, 7.5)
+    >>> e * a
+    Decimal('43.0')
+    >>> u = Vector(3, 0).get_unit_vector()
+    >>> parallel = u.lazy() * (Vector(3, 4) * u)
+    >>> parallel.evaluate(), (Vector(3, 4).lazy() - parallel).evaluate()
+    (Vector(3, 0), Vector(0, 4))
+    """
+
+    __slots__ = ('dimension', 'backend', 'operator', 'operands')
+
+    def __init__(self, vector: Vector, operator=None, operands=()):
+        self.dimension = vector.dimension
+        self.backend = vector.backend
+        self.operator = operator
+        self.operands = operands or (vector,)
+
+    def _combine(self, operator, other) -> 'LazyVector':
+        if isinstance(other, Vector):
+            other = other.lazy()
+        elif not isinstance(other, LazyVector):
+            return NotImplemented
+        assert self.dimension == other.dimension
+        return self._node(operator, (self, other.to_backend(self.backend)))
+
+    def _scale(self, operator, other) -> 'LazyVector':
+        assert isinstance(other, SCALARS)
+        return self._node(operator, (self, self.backend.convert(other)))
+
+    def _node(self, operator, operands) -> 'LazyVector':
+        node = object.__new__(LazyVector)
+        node.dimension = self.dimension
+        node.backend = self.backend
+        node.operator = operator
+        node.operands = operands
+        return node
+
+    def to_backend(self, backend) -> 'LazyVector':
+        if backend is self.backend:
+            return self
+        return self.evaluate().to_backend(backend).lazy()
+
+    def __iter__(self) -> Iterator:
+        """
+        Coordinates of the result, computed one at a time.
+        """
+        if self.operator is None:
+            return iter(self.operands[0].coordinates)
+        if self.operator is neg:
+            return map(neg, self.operands[0])
+
+        left, right = self.operands
+        if isinstance(right, LazyVector):
+            return map(self.operator, left, right)
+        return map(self.operator, left, repeat(right))
+
+    def evaluate(self) -> Vector:
+        return Vector(*self, backend=self.backend)
+
+    def __add__(self, other: Union['LazyVector', Vector]) -> 'LazyVector':
+        return self._combine(add, other)
+
+    def __radd__(self, other: Vector) -> 'LazyVector':
+        """
+        >>> (Vector(1, 2) + Vector(1, 2).lazy()).evaluate()
+        Vector(2, 4)
+        """
+        if not isinstance(other, Vector):
+            return NotImplemented
+        return other.lazy()._combine(add, self)
+
+    def __sub__(self, other: Union['LazyVector', Vector]) -> 'LazyVector':
+        return self._combine(sub, other)
+
+    def __rsub__(self, other: Vector) -> 'LazyVector':
+        """
+        >>> (Vector(3, 3) - Vector(1, 2).lazy()).evaluate()
+        Vector(2, 1)
+        """
+        if not isinstance(other, Vector):
+            return NotImplemented
+        return other.lazy()._combine(sub, self)
+
+    def __mul__(self, other):
+        """
+        >>> Vector(1, 2) * Vector(3, 4).lazy()
+        Decimal('11')
+        """
+        if isinstance(other, (LazyVector, Vector)):
+            assert self.dimension == other.dimension
+            other = other.to_backend(self.backend)
+            return sum(map(mul, self, other))
+        if not isinstance(other, SCALARS):
+            return NotImplemented
+        return self._scale(mul, other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other) -> 'LazyVector':
+        return self._scale(truediv, other)
+
+    def __neg__(self) -> 'LazyVector':
+        """
+        >>> (-Vector(1, -2).lazy()).evaluate()
+        Vector(-1, 2)
+        """
+        return self._node(neg, (self,))
+
+    _SYMBOLS = {add: '+', sub: '-', mul: '*', truediv: '/'}
+
+    @staticmethod
+    def _operand(operand) -> str:
+        if not isinstance(operand, LazyVector):
+            return str(operand)
+        if operand.operator is None:
+            return str(operand.operands[0])
+        return f'({operand._expression()})'
+
+    def _expression(self) -> str:
+        if self.operator is None:
+            return str(self.operands[0])
+        if self.operator is neg:
+            return f'-{self._operand(self.operands[0])}'
+
+        left, right = map(self._operand, self.operands)
+        return f'{left} {self._SYMBOLS[self.operator]} {right}'
+
+    def __str__(self):
+        return f"{self.__class__.__name__}({self._expression()})"
+
+    __repr__ = __str__
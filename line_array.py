@@ -0,0 +1,125 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from typing import Iterable, List, Tuple, Union
+
+import numpy as np
+
+from line import Line
+from tools import is_zero
+from vector import Vector
+
+
+def _negligible(difference: np.ndarray, left: np.ndarray,
+                right: np.ndarray) -> np.ndarray:
+    return abs(difference) <= 1e-10 * (abs(left) + abs(right))
+
+
+class LineArray:
+    """
+    N lines ``a*x_0 + b*x_1 = k`` packed into float64 arrays, for
+    intersecting many lines in one vectorized pass.
+
+    >>> lines = LineArray.from_lines([Line(Vector(3, -3), 3),
+    ...                               Line(Vector(4, 6), 10),
+    ...                               Line(Vector(4, 6), 3)])
+    >>> len(lines)
+    3
+    >>> lines[1]
+    Line(4x_0+6x_1=10)
+    """
+
+    def __init__(self, normals, constants):
+        self.normals = np.ascontiguousarray(normals, dtype=np.float64)
+        self.constants = np.ascontiguousarray(constants, dtype=np.float64)
+
+        assert self.normals.ndim == 2 and self.normals.shape[1] == 2, \
+            'LineArray expects an (N, 2) array of normal vectors'
+        assert self.constants.shape == self.normals.shape[:1]
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[Line]) -> 'LineArray':
+        lines = list(lines)
+        return cls(np.array([tuple(l.normal_vector) for l in lines],
+                            dtype=np.float64).reshape(-1, 2),
+                   np.array([l.constant_term for l in lines],
+                            dtype=np.float64))
+
+    def to_lines(self) -> List[Line]:
+        return [self[i] for i in range(len(self))]
+
+    def intersect(self, other: Union[Line, 'LineArray']) \
+            -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Intersect ``other`` with every line of the array, following the
+        rules of ``Line.get_intersection``.
+
+        Returns ``(points, parallel, coincident)``. For a single ``Line``
+        ``points`` has shape ``(N, 2)`` and the flags shape ``(N,)``; for
+        a ``LineArray`` of Q query lines the shapes are ``(Q, N, 2)`` and
+        ``(Q, N)``. ``coincident`` marks equal lines, ``parallel`` marks
+        parallel but distinct ones, and both have NaN points.
+
+        >>> lines = LineArray.from_lines([Line(Vector(3, -3), 3),
+        ...                               Line(Vector(4, 6), 10),
+        ...                               Line(Vector(4, 6), 3)])
+        >>> points, parallel, coincident = lines.intersect(
+        ...     Line(Vector(2, 3), 5))
+        >>> points
+        array([[1.6, 0.6],
+               [nan, nan],
+               [nan, nan]])
+        >>> parallel, coincident
+        (array([False, False,  True]), array([False,  True, False]))
+        >>> points, _, _ = lines.intersect(LineArray.from_lines(
+        ...     [Line(Vector(3, 3), 6), Line(Vector(1, 0), 0)]))
+        >>> points.shape
+        (2, 3, 2)
+        >>> points[0, 0]
+        array([1.5, 0.5])
+        >>> LineArray.from_lines([Line(Vector('1e-6', 0), '1e-6')]).intersect(
+        ...     Line(Vector(0, '1e-6'), '1e-6'))[0]
+        array([[1., 1.]])
+        """
+        if isinstance(other, Line):
+            other = LineArray.from_lines([other])
+            points, parallel, coincident = self.intersect(other)
+            return points[0], parallel[0], coincident[0]
+
+        # Query lines go along the first axis, stored lines along the second
+        a, b = other.normals[:, None, 0], other.normals[:, None, 1]
+        c, d = self.normals[None, :, 0], self.normals[None, :, 1]
+        k1, k2 = other.constants[:, None], self.constants[None, :]
+
+        # Differences of products are compared with the products themselves,
+        # so the tests do not depend on the scale of the coefficients
+        determinant = a * d - b * c
+        same_direction = _negligible(determinant, a * d, b * c)
+
+        query_zero = is_zero(a) & is_zero(b)
+        line_zero = is_zero(c) & is_zero(d)
+        both_zero = query_zero & line_zero
+
+        coincident = np.where(
+            both_zero, is_zero(k1 - k2),
+            same_direction & ~query_zero & ~line_zero &
+            _negligible(a * k2 - c * k1, a * k2, c * k1) &
+            _negligible(b * k2 - d * k1, b * k2, d * k1))
+        parallel = same_direction & ~coincident
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = (d * k1 - b * k2) / determinant
+            y = (a * k2 - c * k1) / determinant
+
+        points = np.stack([x, y], axis=-1)
+        points[same_direction] = np.nan
+
+        return points, parallel, coincident
+
+    def __len__(self):
+        return self.normals.shape[0]
+
+    def __getitem__(self, item) -> Union[Line, 'LineArray']:
+        if isinstance(item, slice):
+            return LineArray(self.normals[item], self.constants[item])
+        a, b = self.normals[item].tolist()
+        return Line(Vector(a, b), self.constants[item].item())
@@ -2,12 +2,17 @@
 # -*- coding: utf-8 -*-
 from typing import Iterable, Union
 
-from copy import deepcopy
-
 from decimal import Decimal
 
+import instrumentation
+from lu import LUFactorization
+from matrix import AugmentedMatrix
+from bareiss import ExactEchelonForm
+from cache import LRUCache
+from hyperplane import Hyperplane, unique_hyperplanes
 from plane import Plane
-from tools import first_nonzero_index, is_zero
+from solvers import ITERATIVE_METHODS, SolverResult, refine
+from tools import FRACTION, NumericBackend, first_nonzero_index, get_backend
 from vector import Vector
 
 
@@ -31,18 +36,105 @@ class Parametrization:
 
         return res
 
+    def copy(self) -> 'Parametrization':
+        return Parametrization(self.basepoint, list(self.direction_vectors))
+
+
+_MISSING = object()
+
 
 class LinearSystem:
+    """
+    Set ``LinearSystem.cache`` to an ``LRUCache`` to reuse the results of
+    ``compute_rref``, ``solve`` and ``build_parametrization`` across
+    systems. ``solve`` is keyed on ``fingerprint()``, so reordered and
+    rescaled equations hit the same entry; ``compute_rref`` depends on
+    the row order and is keyed on the exact rows.
+
+    >>> LinearSystem.cache = LRUCache(128)
+    >>> LinearSystem(Plane(Vector(1, 1, 1), 1),
+    ...              Plane(Vector(0, 1, 0), 2),
+    ...              Plane(Vector(1, 0, -1), 3)).solve()
+    Vector(1.0, 2.0, -2.0)
+    >>> LinearSystem(Plane(Vector(0, 2, 0), 4),
+    ...              Plane(Vector(-1, 0, 1), -3),
+    ...              Plane(Vector(1, 1, 1), 1)).solve()
+    Vector(1.0, 2.0, -2.0)
+    >>> LinearSystem.cache.stats()
+    {'hits': 1, 'misses': 1, 'evictions': 0, 'size': 1, 'maxsize': 128}
+    >>> LinearSystem.cache = None
+    """
+
+    cache: LRUCache = None
 
     def __init__(self,
-                 *planes: Union[Plane, Vector]):
+                 *planes: Hyperplane,
+                 backend: Union[str, NumericBackend] = None):
+        """
+        >>> s = LinearSystem(Plane(Vector(1, 1, 1), 1),
+        ...                  Plane(Vector(0, 1, 1), 2), backend='float')
+        >>> s[1]
+        Plane(Vector(0.0, 1.0, 1.0), 2.0)
+        >>> s = LinearSystem(Hyperplane(Vector(1, 0, 0, 1), 2),
+        ...                  Hyperplane(Vector(0, 1, 0, 0), 3),
+        ...                  Hyperplane(Vector(0, 0, 1, 0), 4),
+        ...                  Hyperplane(Vector(0, 0, 0, 1), 1))
+        >>> s.solve()
+        Vector(1, 3, 4, 1)
+        """
+        if backend is None:
+            backend = planes[0].backend
+        self.backend = get_backend(backend)
 
-        self.planes = list(planes)
+        self.planes = [p.to_backend(self.backend) for p in planes]
         self.dimension = self.planes[0].dimension
         for p in self.planes[1:]:
             assert p.dimension == self.dimension, \
                 'All planes in the system should live in the same dimension'
 
+    def to_matrix(self) -> AugmentedMatrix:
+        """
+        >>> LinearSystem(Plane(Vector(1, 2, 3), 4),
+        ...              Plane(Vector(0, 1, 0), 2)).to_matrix()
+        AugmentedMatrix([1, 2, 3, 4], [0, 1, 0, 2])
+        """
+        return AugmentedMatrix.from_planes(self.planes, self.backend)
+
+    def from_matrix(self, matrix: AugmentedMatrix) -> 'LinearSystem':
+        """
+        Build a new system of the same plane type out of ``matrix`` rows.
+        """
+        assert matrix.dimension == self.dimension
+        return LinearSystem(*matrix.to_planes(type(self.planes[0])),
+                            backend=self.backend)
+
+    def remove_redundant_equations(self) -> 'LinearSystem':
+        """
+        New system without ``0 = 0`` rows and without equations that are
+        scalings or near-duplicates of an earlier one, see
+        ``unique_hyperplanes``. Runs in one hashing pass, so it is cheap to
+        call before elimination, and leaves the solution unchanged.
+
+        >>> s = LinearSystem(Plane(Vector(1, 1, 1), 1),
+        ...                  Plane(Vector(0, 0, 0), 0),
+        ...                  Plane(Vector(2, 2, 2), 2),
+        ...                  Plane(Vector(0, 1, 0), 2),
+        ...                  Plane(Vector(0, -3, 0), -6))
+        >>> print(s.remove_redundant_equations())
+        Linear System:
+        Equation 1: Plane(Vector(1, 1, 1), 1)
+        Equation 2: Plane(Vector(0, 1, 0), 2)
+        >>> print(LinearSystem(Plane(Vector(1, 1, 1), 1),
+        ...                    Plane(Vector(1, 1, 1), '1.0000000004'))
+        ...       .remove_redundant_equations().solve())
+        None
+        """
+        is_zero = self.backend.is_zero
+        planes = [p for p in unique_hyperplanes(self.planes)
+                  if p.normal_vector or not is_zero(p.constant_term)]
+        return LinearSystem(*(planes or self.planes[:1]),
+                            backend=self.backend)
+
     def swap_rows(self, index1, index2):
         """
         >>> p0 = Plane(Vector(1, 1, 1), 1)
@@ -129,7 +221,7 @@ class LinearSystem:
         indices = [-1] * num_equations
 
         for i, p in enumerate(self):
-            index = first_nonzero_index(p.normal_vector)
+            index = first_nonzero_index(p.normal_vector, self.backend)
             if index is None:
                 continue
             indices[i] = index
@@ -169,25 +261,9 @@ class LinearSystem:
         >>> t[2]
         Plane(Vector(0, 0, -9), -2)
         """
-        system = deepcopy(self)
-
-        equations = len(system)
-        cycles = min([system.dimension, equations])
-
-        for i in range(cycles):
-            if is_zero(system[i].normal_vector[i]):
-                for j in range(i + 1, equations):
-                    if not is_zero(system[j].normal_vector[i]):
-                        system.swap_rows(i, j)
-                        break
-                else:
-                    continue
-
-            for j in range(i + 1, equations):
-                k = -system[j].normal_vector[i] / system[i].normal_vector[i]
-                system.add_multiple_times_row_to_row(k, i, j)
-
-        return system
+        matrix = self.to_matrix()
+        matrix.triangular()
+        return self.from_matrix(matrix)
     
     def compute_rref(self):
         """
@@ -227,59 +303,246 @@ class LinearSystem:
         >>> r[2] == Plane(Vector(0, 0, 1), Decimal(2)/Decimal(9))
         True
         """
-        system = self.compute_triangular_form()
-
-        for i, plane in reversed(list(enumerate(system))):
-            j = first_nonzero_index(plane.normal_vector)
-            if j is None:
-                if plane.constant_term:
-                    c = 1 / plane.constant_term
-                    system.multiply_coefficient_and_row(c, i)
-                continue
-
-            system.multiply_coefficient_and_row(1 / plane.normal_vector[j], i)
-
-            for k in range(i - 1, -1, -1):
-                c = -system[k].normal_vector[j]
-                system.add_multiple_times_row_to_row(c, i, k)
-
-        return system
+        if self.cache is None:
+            return self._compute_rref()
+
+        key = ('rref', type(self.planes[0]), self.backend.name,
+               self._row_key())
+        planes = self.cache.get(key, _MISSING)
+        if planes is _MISSING:
+            planes = tuple(self._compute_rref().planes)
+            self.cache.put(key, planes)
+        return LinearSystem(*planes, backend=self.backend)
+
+    def _compute_rref(self) -> 'LinearSystem':
+        matrix = self.to_matrix()
+        matrix.rref()
+        return self.from_matrix(matrix)
+
+    def _row_key(self) -> tuple:
+        return tuple(tuple(p.normal_vector.coordinates) + (p.constant_term,)
+                     for p in self.planes)
+
+    def fingerprint(self) -> tuple:
+        """
+        Key shared by systems with the same equations in any order and at
+        any scale. Rows are canonicalized exactly, without rounding, so
+        systems that only agree approximately get different keys.
+
+        >>> LinearSystem(Plane(Vector(1, 2, 3), 4),
+        ...              Plane(Vector(0, 1, 0), 2)).fingerprint() == \\
+        ...     LinearSystem(Plane(Vector(0, 3, 0), 6),
+        ...                  Plane(Vector(-1, -2, -3), -4)).fingerprint()
+        True
+        """
+        rows = sorted(p.canonical_row() for p in self.planes)
+        return self.backend.name, self.dimension, tuple(rows)
 
     def solve(self):
-        system = self.compute_rref()
-        answer = [0] * system.dimension
+        """
+        >>> LinearSystem(Plane(Vector(0, 1, 1), 1),
+        ...              Plane(Vector(1, -1, 1), 2),
+        ...              Plane(Vector(1, 2, -5), 3),
+        ...              backend='fraction').solve()
+        Vector(23/9, 7/9, 2/9)
+        """
+        if self.cache is None:
+            return self._solve()
+
+        key = ('solve',) + self.fingerprint()
+        solution = self.cache.get(key, _MISSING)
+        if solution is _MISSING:
+            solution = self._solve()
+            self.cache.put(key, solution)
+        if isinstance(solution, Parametrization):
+            return solution.copy()
+        return solution
+
+    def _solve(self):
+        matrix = self.to_matrix()
+        matrix.rref()
+
+        answer = [0] * self.dimension
         useful_equations = []
-        for i, plane in enumerate(system):
-            j = first_nonzero_index(plane.normal_vector)
+        for i in range(len(matrix)):
+            j = matrix.first_nonzero_index(i)
             if j is None:
-                if not is_zero(plane.constant_term):
+                if not self.backend.is_zero(matrix.rows[i, -1]):
                     return None
                 continue
-            useful_equations.append(plane)
-            answer[j] = plane.constant_term
+            useful_equations.append(i)
+            answer[j] = matrix.rows[i, -1]
 
         if len(useful_equations) < self.dimension:
-            return self.build_parametrization(useful_equations)
+            plane_type = type(self.planes[0])
+            return self.build_parametrization(
+                [matrix.row_to_plane(i, plane_type) for i in useful_equations])
+
+        return Vector(*answer, backend=self.backend)
+
+    def solve_refined(self, tolerance: Union[str, float, Decimal] = '1e-24',
+                      max_iterations: int = 10) -> SolverResult:
+        """
+        Near-Decimal accuracy at close to float speed: float64 LU plus
+        iterative refinement with Decimal residuals, falling back to
+        Decimal elimination when refinement does not converge. See
+        ``solvers.refine``.
+
+        >>> r = LinearSystem(Plane(Vector(0, 1, 1), 1),
+        ...                  Plane(Vector(1, -1, 1), 2),
+        ...                  Plane(Vector(1, 2, -5), 3)).solve_refined()
+        >>> r.converged, r.iterations
+        (True, 2)
+        """
+        return refine(self, tolerance, max_iterations)
+
+    def solve_iterative(self, method: str = 'cg',
+                        tolerance: Union[str, float] = '1e-10',
+                        max_iterations: int = None, initial: Vector = None,
+                        **options) -> SolverResult:
+        """
+        Solve a large square system iteratively instead of by O(n^3)
+        elimination. ``method`` is ``'jacobi'``, ``'gauss-seidel'`` (pass
+        ``omega`` for SOR) or ``'cg'`` (pass ``preconditioner``);
+        ``initial`` warm-starts from a previous solution.
+
+        >>> s = LinearSystem(Plane(Vector(4, 1, 0), 1),
+        ...                  Plane(Vector(1, 4, 1), 2),
+        ...                  Plane(Vector(0, 1, 4), 3))
+        >>> r = s.solve_iterative('gauss-seidel', omega='1.05')
+        >>> r.method, r.converged
+        ('sor', True)
+        >>> s.solve_iterative(initial=r.solution).iterations
+        0
+        """
+        assert method in ITERATIVE_METHODS, \
+            f'method should be one of {tuple(ITERATIVE_METHODS)}'
+        if max_iterations is not None:
+            options['max_iterations'] = max_iterations
+        return ITERATIVE_METHODS[method](self, tolerance, initial=initial,
+                                         **options)
+
+    def compute_exact_echelon_form(self) -> ExactEchelonForm:
+        """
+        Fraction-free echelon form of the system, with exact rank and
+        consistency. Coefficients are taken exactly as stored, so build the
+        system with the fraction backend to keep tiny values from being
+        rounded to zero on input.
+
+        >>> e = LinearSystem(Plane(Vector(1, 1, 1), 1),
+        ...                  Plane(Vector(0, 1, 0), 2),
+        ...                  Plane(Vector(1, 1, -1), 3),
+        ...                  Plane(Vector(1, 0, -2), 2)
+        ...                  ).compute_exact_echelon_form()
+        >>> e.rank, e.is_consistent
+        (3, True)
+        """
+        return ExactEchelonForm(
+            list(p.normal_vector) + [p.constant_term] for p in self.planes)
+
+    def solve_exact(self):
+        """
+        Solve with exact rational arithmetic, the result uses the fraction
+        backend.
+
+        >>> LinearSystem(Plane(Vector(0, 1, 1), 1),
+        ...              Plane(Vector(1, -1, 1), 2),
+        ...              Plane(Vector(1, 2, -5), 3)).solve_exact()
+        Vector(23/9, 7/9, 2/9)
+        >>> s = LinearSystem(
+        ...     Hyperplane(Vector('1e-12', 1, backend='fraction'), 1),
+        ...     Hyperplane(Vector(0, 1, backend='fraction'), 0))
+        >>> s.solve_exact()
+        Vector(1000000000000, 0)
+        >>> print(LinearSystem(Plane(Vector(1, 1, 1), 1),
+        ...                    Plane(Vector(2, 2, 2), 2)).solve_exact())
+        [x_0, x_1, x_2] = Vector(1, 0, 0) + x_1 * Vector(-1, 1, 0) + \
+x_2 * Vector(-1, 0, 1)
+        >>> print(LinearSystem(Plane(Vector(0, 0, 0), 0)).solve_exact())
+        [x_0, x_1, x_2] = Vector(0, 0, 0) + x_0 * Vector(1, 0, 0) + \
+x_1 * Vector(0, 1, 0) + x_2 * Vector(0, 0, 1)
+        """
+        echelon = self.compute_exact_echelon_form()
+        if not echelon.is_consistent:
+            return None
+
+        plane_type = type(self.planes[0])
+        equations = [plane_type(Vector(*coefficients, backend=FRACTION),
+                                constant)
+                     for coefficients, constant in echelon.reduced_rows()]
+
+        if echelon.rank < self.dimension:
+            # The reduced rows may be empty for a rank 0 system, so build
+            # the parametrization through this system in the exact backend
+            system = LinearSystem(*self.planes, backend=FRACTION)
+            return system.build_parametrization(equations)
+
+        answer = [0] * self.dimension
+        for c, equation in zip(echelon.pivot_columns, equations):
+            answer[c] = equation.constant_term
+        return Vector(*answer, backend=FRACTION)
+
+    def factorize(self) -> LUFactorization:
+        """
+        LU factorization of the coefficient matrix, to solve the same system
+        against many different constant terms.
 
-        return Vector(*answer)
+        >>> s = LinearSystem(Plane(Vector(0, 1, 1), 1),
+        ...                  Plane(Vector(1, -1, 1), 2),
+        ...                  Plane(Vector(1, 2, -5), 3), backend='fraction')
+        >>> lu = s.factorize()
+        >>> lu.solve([p.constant_term for p in s])
+        Vector(23/9, 7/9, 2/9)
+        >>> lu.solve_many([[0, 0, 0], [1, 0, 0]])
+        [Vector(0, 0, 0), Vector(1/3, 2/3, 1/3)]
+        """
+        return LUFactorization(self.to_matrix())
+
+    def build_parametrization(self, equations: Iterable[Hyperplane]):
+        if self.cache is None:
+            with instrumentation.phase('parametrization'):
+                return self._build_parametrization(equations)
+
+        equations = list(equations)
+        key = ('parametrization', self.backend.name, self.dimension,
+               tuple(tuple(e.normal_vector.coordinates) + (e.constant_term,)
+                     for e in equations))
+        parametrization = self.cache.get(key, _MISSING)
+        if parametrization is _MISSING:
+            with instrumentation.phase('parametrization'):
+                parametrization = self._build_parametrization(equations)
+            self.cache.put(key, parametrization)
+        return parametrization.copy()
+
+    def _build_parametrization(self, equations: Iterable[Hyperplane]):
+        """
+        Every column without a pivot is a free variable with its own
+        direction, also when no equation mentions it.
 
-    def build_parametrization(self, equations: Iterable[Plane]):
-        free_variables = []
+        >>> print(LinearSystem(Plane(Vector(1, 1, 0), 1)).solve())
+        [x_0, x_1, x_2] = Vector(1, 0, 0) + x_1 * Vector(-1, 1, 0) + \
+x_2 * Vector(0, 0, 1)
+        """
+        pivot_columns = set()
         for equation in equations:
-            free_variables.append(first_nonzero_index(equation.normal_vector))
+            pivot_columns.add(
+                first_nonzero_index(equation.normal_vector, self.backend))
 
         vectors = [[0] * self.dimension for _ in range(self.dimension)]
+        for c in range(self.dimension):
+            if c not in pivot_columns:
+                vectors[c][c] = 1
         basepoint = [0] * self.dimension
         for equation in equations:
-            j = first_nonzero_index(equation.normal_vector)
+            j = first_nonzero_index(equation.normal_vector, self.backend)
             basepoint[j] = equation.constant_term
             for i, k in enumerate(equation.normal_vector[j+1:]):
                 if k:
                     vectors[i + j + 1][j] = -k
-                    vectors[i + j + 1][i + j + 1] = 1
 
-        return Parametrization(Vector(*basepoint),
-                               [Vector(*vector) for vector in vectors])
+        return Parametrization(Vector(*basepoint, backend=self.backend),
+                               [Vector(*vector, backend=self.backend)
+                                for vector in vectors])
 
     def __len__(self):
         return len(self.planes)
@@ -294,7 +557,7 @@ class LinearSystem:
         assert x.dimension == self.dimension, \
             'All planes in the system should live in the same dimension'
 
-        self.planes[i] = x
+        self.planes[i] = x.to_backend(self.backend)
 
     def __str__(self):
         ret = 'Linear System:\n'
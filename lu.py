@@ -0,0 +1,105 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from typing import Iterable, List, Sequence, Union
+
+import numpy as np
+
+from matrix import AugmentedMatrix
+from vector import Vector
+
+
+class SingularMatrixException(Exception):
+    """"""
+
+
+class LUFactorization:
+    """
+    ``PA = LU`` factorization of a square coefficient matrix with partial
+    pivoting. Factorizing costs O(n^3) once, every right-hand side after
+    that is solved by forward and back substitution in O(n^2).
+
+    ``L`` (unit diagonal) and ``U`` are stored together in ``lu``.
+
+    >>> m = AugmentedMatrix([[2, 1, 1], [4, 3, 5]])
+    >>> lu = LUFactorization(m)
+    >>> lu.solve(Vector(1, 5))
+    Vector(-1, 3)
+    >>> lu.solve_many([Vector(1, 5), [2, 4], Vector(0, 0)])
+    [Vector(-1, 3), Vector(1, 0), Vector(0, 0)]
+    >>> LUFactorization(AugmentedMatrix([[1, 2, 0], [2, 4, 0]]))
+    Traceback (most recent call last):
+    ...
+    lu.SingularMatrixException: Matrix is singular at column 1
+    """
+
+    def __init__(self, matrix: AugmentedMatrix):
+        assert len(matrix) == matrix.dimension, \
+            'LU factorization needs a square coefficient matrix'
+
+        self.backend = matrix.backend
+        self.dimension = matrix.dimension
+        self.lu = matrix.rows[:, :-1].copy()
+        self.permutation = np.arange(self.dimension)
+
+        self._factorize()
+
+    def _factorize(self):
+        lu = self.lu
+        is_zero = self.backend.is_zero
+
+        for k in range(self.dimension):
+            p = k + int(np.argmax(abs(lu[k:, k])))
+            if is_zero(lu[p, k]):
+                raise SingularMatrixException(
+                    f'Matrix is singular at column {k}')
+
+            if p != k:
+                lu[[k, p]] = lu[[p, k]]
+                self.permutation[[k, p]] = self.permutation[[p, k]]
+
+            lu[k + 1:, k] /= lu[k, k]
+            lu[k + 1:, k + 1:] -= np.outer(lu[k + 1:, k], lu[k, k + 1:])
+
+    def solve(self, constants: Union[Vector, Sequence]) -> Vector:
+        return self.solve_many([constants])[0]
+
+    def solve_many(self, constants: Iterable[Union[Vector, Sequence]]) \
+            -> List[Vector]:
+        convert = self.backend.convert
+        columns = [[convert(x) for x in b] for b in constants]
+        assert all(len(b) == self.dimension for b in columns)
+        if not columns:
+            return []
+
+        solution = self.solve_array(np.array(columns, dtype=self.lu.dtype).T)
+
+        return [Vector(*x, backend=self.backend)
+                for x in solution.T.tolist()]
+
+    def solve_array(self, rhs: np.ndarray) -> np.ndarray:
+        """
+        Solve for a right-hand side vector or a matrix of right-hand side
+        columns given as an array of the factorization's own dtype, without
+        building ``Vector`` objects.
+
+        >>> from tools import FLOAT
+        >>> matrix = AugmentedMatrix([[2, 1, 1], [4, 3, 5]], FLOAT)
+        >>> lu = LUFactorization(matrix)
+        >>> lu.solve_array(np.array([1., 5.]))
+        array([-1.,  3.])
+        """
+        return self._substitute(rhs[self.permutation])
+
+    def _substitute(self, rhs):
+        lu = self.lu
+        n = self.dimension
+
+        for i in range(1, n):
+            rhs[i] -= lu[i, :i] @ rhs[:i]
+
+        for i in reversed(range(n)):
+            if i + 1 < n:
+                rhs[i] -= lu[i, i + 1:] @ rhs[i + 1:]
+            rhs[i] /= lu[i, i]
+
+        return rhs
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from typing import Iterable, List
+
+import numpy as np
+
+import instrumentation
+from tools import DECIMAL, FLOAT, NumericBackend
+from vector import Vector
+
+
+class AugmentedMatrix:
+    """
+    Dense ``[A | b]`` representation of a linear system.
+
+    Row operations and elimination run in place on a single numpy array.
+    The float backend is stored as float64, other backends keep their
+    number objects in an object array, so Decimal and Fraction arithmetic
+    is preserved while the per-row loops still run inside numpy.
+
+    >>> m = AugmentedMatrix([[1, 1, 1, 1], [0, 1, 1, 2]])
+    >>> m.rref()
+    >>> m
+    AugmentedMatrix([1, 0, 0, -1], [0, 1, 1, 2])
+    """
+
+    def __init__(self, rows, backend: NumericBackend = DECIMAL):
+        self.backend = backend
+
+        if backend is FLOAT:
+            self.rows = np.array(rows, dtype=np.float64)
+        else:
+            convert = backend.convert
+            self.rows = np.array([[convert(x) for x in row] for row in rows],
+                                 dtype=object)
+
+        assert self.rows.ndim == 2, 'AugmentedMatrix expects a 2D array'
+
+        self.dimension = self.rows.shape[1] - 1
+
+    @classmethod
+    def from_planes(cls, planes: Iterable, backend: NumericBackend) \
+            -> 'AugmentedMatrix':
+        return cls([list(p.normal_vector.coordinates) + [p.constant_term]
+                    for p in planes], backend)
+
+    def to_planes(self, plane_type) -> List:
+        return [self.row_to_plane(i, plane_type) for i in range(len(self))]
+
+    def row_to_plane(self, i: int, plane_type):
+        row = self.rows[i].tolist()
+        return plane_type(Vector(*row[:-1], backend=self.backend), row[-1])
+
+    def first_nonzero_index(self, i: int) -> int:
+        nonzero = np.flatnonzero(~self.zero_mask(self.rows[i, :-1]))
+        if len(nonzero):
+            return int(nonzero[0])
+
+    def swap_rows(self, index1: int, index2: int):
+        if instrumentation.ACTIVE is not None:
+            instrumentation.ACTIVE.count('swap_rows')
+        self.rows[[index1, index2]] = self.rows[[index2, index1]]
+
+    def multiply_coefficient_and_row(self, coefficient, index: int):
+        if instrumentation.ACTIVE is not None:
+            instrumentation.ACTIVE.count('multiply_coefficient_and_row')
+        row = self.rows[index]
+        row *= self.backend.convert(coefficient)
+        self.snap(row)
+
+    def add_multiple_times_row_to_row(self, coefficient, index_to_add: int,
+                                      index_to_be_added: int):
+        if instrumentation.ACTIVE is not None:
+            instrumentation.ACTIVE.count('add_multiple_times_row_to_row')
+        row = self.rows[index_to_be_added]
+        row += self.rows[index_to_add] * self.backend.convert(coefficient)
+        self.snap(row)
+
+    def triangular(self):
+        """
+        Bring the matrix to row echelon form in place. Columns without a
+        pivot are skipped while the pivot row stays, so every row starts
+        strictly to the right of the one above it.
+
+        >>> m = AugmentedMatrix([[0, 1, 1, 1], [1, -1, 1, 2], [1, 2, -5, 3]])
+        >>> m.triangular()
+        >>> m
+        AugmentedMatrix([1, -1, 1, 2], [0, 1, 1, 1], [0, 0, -9, -2])
+        >>> m = AugmentedMatrix([[0, 1, 0, 1], [0, 1, 1, 2]])
+        >>> m.triangular()
+        >>> m
+        AugmentedMatrix([0, 1, 0, 1], [0, 0, 1, 1])
+
+        The float backend pivots on the largest entry of each column:
+
+        >>> m = AugmentedMatrix([[1e-9, 1, 1], [1, 1, 2]], FLOAT)
+        >>> m.rref()
+        >>> m.rows[:, -1].round(15).tolist()
+        [1.000000001, 0.999999999]
+        """
+        with instrumentation.phase('triangular'):
+            self._triangular()
+
+    def _triangular(self):
+        rows = self.rows
+        equations = len(self)
+        recorder = instrumentation.ACTIVE
+
+        i = 0
+        for j in range(self.dimension):
+            if i == equations:
+                break
+
+            if self.backend is not FLOAT:
+                # Fractions are exact and Decimal carries enough digits, so
+                # the first nonzero entry is as good a pivot as any and
+                # results keep their natural scale
+                candidates = np.flatnonzero(~self.zero_mask(rows[i:, j]))
+                if not len(candidates):
+                    continue
+                pivot = i + int(candidates[0])
+            else:
+                # Partial pivoting for float64: the largest entry of the
+                # column keeps every elimination factor at most 1 in
+                # magnitude
+                pivot = i + int(np.argmax(np.abs(rows[i:, j])))
+                if self.zero_mask(rows[pivot, j]):
+                    continue
+            if pivot != i:
+                self.swap_rows(i, pivot)
+
+            if recorder is not None:
+                recorder.pivot('triangular', i, j, rows[i, j])
+
+            if i + 1 < equations:
+                if recorder is not None:
+                    # One block update stands for a row addition per row
+                    # below
+                    recorder.count('add_multiple_times_row_to_row',
+                                   equations - i - 1)
+
+                factors = -rows[i + 1:, j] / rows[i, j]
+                block = rows[i + 1:, j:]
+                block += np.outer(factors, rows[i, j:])
+                self.snap(block)
+
+            i += 1
+
+    def rref(self):
+        """
+        Bring the matrix to reduced row echelon form in place.
+
+        >>> m = AugmentedMatrix([[1, 1, 1, 1], [1, 1, 1, 2]])
+        >>> m.rref()
+        >>> m
+        AugmentedMatrix([1, 1, 1, 1], [0, 0, 0, 1])
+        """
+        self.triangular()
+
+        with instrumentation.phase('rref'):
+            self._back_substitute()
+
+    def _back_substitute(self):
+        rows = self.rows
+        recorder = instrumentation.ACTIVE
+
+        for i in reversed(range(len(self))):
+            j = self.first_nonzero_index(i)
+            if j is None:
+                if not self.zero_mask(rows[i, -1]):
+                    self.multiply_coefficient_and_row(1 / rows[i, -1], i)
+                continue
+
+            if recorder is not None:
+                recorder.pivot('rref', i, j, rows[i, j])
+
+            self.multiply_coefficient_and_row(1 / rows[i, j], i)
+
+            if i:
+                if recorder is not None:
+                    recorder.count('add_multiple_times_row_to_row', i)
+                block = rows[:i, j:]
+                block -= np.outer(rows[:i, j], rows[i, j:])
+                self.snap(block)
+
+    def zero_mask(self, values):
+        return self.backend.is_zero(values)
+
+    def snap(self, values):
+        # Mirrors the zero snapping ``NumericBackend.convert`` does for
+        # every freshly created Vector coordinate
+        values[self.zero_mask(values)] = self.backend.convert(0)
+
+    def __len__(self):
+        return self.rows.shape[0]
+
+    def __str__(self):
+        rows = ', '.join(
+            '[{}]'.format(', '.join(str(x) for x in row))
+            for row in self.rows.tolist())
+        return f"{self.__class__.__name__}({rows})"
+
+    __repr__ = __str__
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from decimal import Decimal
+from fractions import Fraction
+from itertools import repeat
+from operator import add, mul, sub
+from typing import Iterable, Union
+
+from tools import NumericBackend, get_backend
+from vector import Vector
+
+SCALARS = (int, float, Decimal, Fraction)
+
+
+class MutableVector:
+    """
+    Preallocated vector updated in place, for accumulation and elimination
+    loops that would otherwise build a new ``Vector`` at every step.
+
+    Values are converted by the backend once, on the way in. In-place
+    operations skip the zero snapping ``Vector`` does for every new
+    coordinate; call ``snap()`` where that matters.
+
+    >>> acc = MutableVector.zeros(3)
+    >>> for v in [Vector(1, 2, 3), Vector(1, 1, 1)]:
+    ...     acc += v
+    >>> acc.axpy(2, Vector(0, 0, 1))
+    >>> acc *= 2
+    >>> acc
+    MutableVector(4, 6, 12)
+    >>> acc.freeze() + Vector(1, 1, 1)
+    Vector(5, 7, 13)
+
+    Rows of a ``LinearSystem`` can be eliminated in place as augmented
+    rows and turned back into planes:
+
+    >>> from plane import Plane
+    >>> rows = [MutableVector.from_plane(p) for p in
+    ...         [Plane(Vector(1, 1, 1), 1), Plane(Vector(2, 3, 1), 4)]]
+    >>> rows[1].axpy(-2, rows[0])
+    >>> rows[1].to_plane(Plane)
+    Plane(Vector(0, 1, -1), 2)
+    """
+
+    __slots__ = ('coordinates', 'dimension', 'backend')
+
+    def __init__(self, *coordinates: Union[float, str],
+                 backend: Union[str, NumericBackend] = None):
+        if backend is None:
+            backend = Vector.default_backend
+        else:
+            backend = get_backend(backend)
+
+        convert = backend.convert
+        self.backend = backend
+        self.coordinates = [convert(x) for x in coordinates]
+        self.dimension = len(self.coordinates)
+
+    @classmethod
+    def zeros(cls, dimension: int,
+              backend: Union[str, NumericBackend] = None) -> 'MutableVector':
+        return cls(*([0] * dimension), backend=backend)
+
+    @classmethod
+    def from_vector(cls, vector: Vector) -> 'MutableVector':
+        result = cls.__new__(cls)
+        result.backend = vector.backend
+        result.coordinates = list(vector.coordinates)
+        result.dimension = vector.dimension
+        return result
+
+    @classmethod
+    def from_plane(cls, plane) -> 'MutableVector':
+        """
+        Augmented row ``[normal_vector..., constant_term]`` of ``plane``.
+        """
+        result = cls.from_vector(plane.normal_vector)
+        result.coordinates.append(plane.constant_term)
+        result.dimension += 1
+        return result
+
+    def to_plane(self, plane_type):
+        normal_vector = Vector(*self.coordinates[:-1], backend=self.backend)
+        return plane_type(normal_vector, self.coordinates[-1])
+
+    def freeze(self) -> Vector:
+        return Vector(*self.coordinates, backend=self.backend)
+
+    def to_backend(self, backend: Union[str, NumericBackend]) \
+            -> 'MutableVector':
+        backend = get_backend(backend)
+        if backend is self.backend:
+            return self
+        return MutableVector(*self.coordinates, backend=backend)
+
+    def _values(self, other) -> Iterable:
+        assert self.dimension == other.dimension
+        if other.backend is self.backend:
+            return other.coordinates
+        return map(self.backend.convert, other.coordinates)
+
+    def add(self, other: Union[Vector, 'MutableVector']):
+        self.coordinates[:] = map(add, self.coordinates, self._values(other))
+
+    def sub(self, other: Union[Vector, 'MutableVector']):
+        self.coordinates[:] = map(sub, self.coordinates, self._values(other))
+
+    def scale(self, coefficient):
+        assert isinstance(coefficient, SCALARS)
+        coefficient = self.backend.convert(coefficient)
+        self.coordinates[:] = map(mul, self.coordinates, repeat(coefficient))
+
+    def axpy(self, coefficient, other: Union[Vector, 'MutableVector']):
+        """
+        ``self += coefficient * other`` in one pass.
+
+        >>> y = MutableVector(1, 1)
+        >>> y.axpy(0.5, MutableVector(2, 4, backend='float'))
+        >>> y
+        MutableVector(2.0, 3.0)
+        """
+        assert isinstance(coefficient, SCALARS)
+        coefficient = self.backend.convert(coefficient)
+        self.coordinates[:] = map(
+            add, self.coordinates,
+            map(mul, self._values(other), repeat(coefficient)))
+
+    def snap(self):
+        """
+        >>> v = MutableVector(1, backend='float')
+        >>> v.axpy(-1, Vector(1 - 1e-12, backend='float'))
+        >>> v.snap()
+        >>> v
+        MutableVector(0.0)
+        """
+        is_zero, zero = self.backend.is_zero, self.backend.convert(0)
+        self.coordinates[:] = [zero if is_zero(x) else x
+                               for x in self.coordinates]
+
+    def __iadd__(self, other: Union[Vector, 'MutableVector']):
+        self.add(other)
+        return self
+
+    def __isub__(self, other: Union[Vector, 'MutableVector']):
+        self.sub(other)
+        return self
+
+    def __imul__(self, other):
+        self.scale(other)
+        return self
+
+    def __itruediv__(self, other):
+        """
+        >>> v = MutableVector(1, 2, backend='fraction')
+        >>> v /= 4
+        >>> v
+        MutableVector(1/4, 1/2)
+        """
+        assert isinstance(other, SCALARS)
+        self.scale(1 / self.backend.convert(other))
+        return self
+
+    # Eager and lazy vectors leave mixed operations to these, which freeze
+    # the current coordinates into a ``Vector``
+
+    def __radd__(self, other):
+        """
+        >>> Vector(1, 2) + MutableVector(1, 2)
+        Vector(2, 4)
+        """
+        return other + self.freeze()
+
+    def __rsub__(self, other):
+        """
+        >>> Vector(1, 2) - MutableVector(1, 2)
+        Vector(0, 0)
+        """
+        return other - self.freeze()
+
+    def __rmul__(self, other):
+        """
+        >>> Vector(1, 2) * MutableVector(1, 2)
+        Decimal('5')
+        >>> Vector(1, 2).lazy() * MutableVector(1, 2)
+        Decimal('5')
+        """
+        return other * self.freeze()
+
+    def __eq__(self, other: Union[Vector, 'MutableVector']) -> bool:
+        """
+        >>> MutableVector(1, 2) == Vector(1, 2)
+        True
+        >>> Vector(1, 2) == MutableVector(1, 2)
+        True
+        """
+        return self.dimension == other.dimension and \
+            all(x == y for x, y in zip(self.coordinates, other.coordinates))
+
+    __hash__ = None
+
+    def __len__(self):
+        return self.dimension
+
+    def __iter__(self):
+        return iter(self.coordinates)
+
+    def __getitem__(self, item):
+        return self.coordinates[item]
+
+    def __setitem__(self, item, value):
+        self.coordinates[item] = self.backend.convert(value)
+
+    def __str__(self):
+        s = ', '.join(f'{x}' for x in self.coordinates)
+        return f"{self.__class__.__name__}({s})"
+
+    __repr__ = __str__
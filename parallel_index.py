@@ -0,0 +1,111 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from typing import Dict, Iterable, List
+
+from tools import KEY_DIGITS
+from vector import Vector
+from vector_array import VectorArray
+
+
+class ParallelIndex:
+    """
+    Vectors grouped by ``Vector.direction_key``, so finding every stored
+    vector parallel to a query is one dict lookup instead of a pairwise
+    ``is_parallel`` scan.
+
+    Semantics follow ``Vector.is_parallel``: opposite directions are
+    parallel and a zero vector is parallel to every vector. ``digits``
+    sets how close two directions must be to share a bucket.
+
+    >>> index = ParallelIndex([Vector(1, 2), Vector(-2, -4), Vector(2, 5),
+    ...                        Vector(0, 0), Vector(-4, 2)])
+    >>> index.parallel_to(Vector(3, 6))
+    [Vector(1, 2), Vector(-2, -4), Vector(0, 0)]
+    >>> len(index.parallel_to(Vector(0, 0)))
+    5
+    >>> index.orthogonal_to(Vector(2, 4))
+    [Vector(0, 0), Vector(-4, 2)]
+    >>> len(index.groups())
+    4
+    """
+
+    def __init__(self, vectors: Iterable[Vector] = (),
+                 digits: int = KEY_DIGITS):
+        self.digits = digits
+        self.vectors: List[Vector] = []
+        self.buckets: Dict[tuple, List[int]] = {}
+        self.zero_vectors: List[int] = []
+        self._array = None
+
+        self.extend(vectors)
+
+    def add(self, vector: Vector) -> int:
+        """
+        Store ``vector`` and return its position in ``vectors``.
+        """
+        if self.vectors:
+            assert vector.dimension == self.vectors[0].dimension
+
+        position = len(self.vectors)
+        self.vectors.append(vector)
+        self._array = None
+
+        key = vector.direction_key(self.digits)
+        if key is None:
+            self.zero_vectors.append(position)
+        else:
+            self.buckets.setdefault(key, []).append(position)
+
+        return position
+
+    def extend(self, vectors: Iterable[Vector]):
+        for vector in vectors:
+            self.add(vector)
+
+    def parallel_indices(self, vector: Vector) -> List[int]:
+        key = vector.direction_key(self.digits)
+        if key is None:
+            return list(range(len(self.vectors)))
+        return sorted(self.buckets.get(key, []) + self.zero_vectors)
+
+    def parallel_to(self, vector: Vector) -> List[Vector]:
+        return [self.vectors[i] for i in self.parallel_indices(vector)]
+
+    def orthogonal_to(self, vector: Vector) -> List[Vector]:
+        """
+        Stored vectors orthogonal to ``vector``. Orthogonality cannot be
+        bucketed, so this is one vectorized pass over all of them.
+        """
+        if not self.vectors:
+            return []
+
+        if self._array is None:
+            self._array = VectorArray.from_vectors(self.vectors)
+
+        products = self._array.get_unit_vector() * vector.get_unit_vector()
+        tolerance = 10.0 ** -self.digits
+        return [self.vectors[i] for i, product in enumerate(products)
+                if abs(product) < tolerance]
+
+    def groups(self) -> List[List[Vector]]:
+        """
+        Stored nonzero vectors split into parallel classes, in order of
+        first appearance. Zero vectors form a group of their own.
+        """
+        groups = [[self.vectors[i] for i in positions]
+                  for positions in self.buckets.values()]
+        if self.zero_vectors:
+            groups.append([self.vectors[i] for i in self.zero_vectors])
+        return groups
+
+    def __len__(self):
+        return len(self.vectors)
+
+
+def group_by_direction(vectors: Iterable[Vector],
+                       digits: int = KEY_DIGITS) -> List[List[Vector]]:
+    """
+    >>> group_by_direction([Vector(1, 0), Vector(0, 1), Vector(-3, 0)])
+    [[Vector(1, 0), Vector(-3, 0)], [Vector(0, 1)]]
+    """
+    return ParallelIndex(vectors, digits).groups()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+"""
+Long-lived HTTP service around ``LinearSystem.solve`` and
+``Line.get_intersection``.
+
+    python service.py --port 8080 --workers 4
+
+    POST /solve      {"equations": [[a_0, ..., c], ...], "backend": ...}
+    POST /intersect  {"lines": [[a, b, c], [a, b, c]], "backend": ...}
+    GET  /stats
+
+Requests arriving within ``window`` seconds of each other are grouped
+into one batch of at most ``max_batch`` and solved in an executor, so the
+event loop only parses and routes. At most ``queue_size`` requests wait
+for a batch; beyond that the service answers 503 right away.
+
+>>> from concurrent.futures import ThreadPoolExecutor
+>>> async def demo():
+...     service = SolveService(port=0, executor=ThreadPoolExecutor(1))
+...     await service.start()
+...     port = service.server.sockets[0].getsockname()[1]
+...     replies = await asyncio.gather(
+...         _request(port, 'POST', '/solve',
+...                  {'equations': [[1, 0, 2], [0, 1, 3]]}),
+...         _request(port, 'POST', '/intersect',
+...                  {'lines': [[3, 3, 6], [3, -3, 3]]}),
+...         _request(port, 'POST', '/solve', {'equations': [[1]]}),
+...         _request(port, 'GET', '/nowhere'))
+...     stats = (await _request(port, 'GET', '/stats'))[1]
+...     await service.close()
+...     return replies, stats
+>>> replies, stats = asyncio.run(demo())
+>>> for reply in replies:
+...     print(reply)
+(200, {'status': 'unique', 'solution': ['2', '3']})
+(200, {'status': 'point', 'point': ['1.5', '0.5']})
+(400, {'error': 'An equation needs coefficients and a constant'})
+(404, {'error': 'Not found'})
+>>> stats['completed'], stats['failed'], stats['rejected']
+(2, 1, 0)
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from decimal import Decimal, getcontext
+from typing import List, Tuple
+
+from batch import init_worker
+from cli import INPUT_ERRORS, build_system, format_solution, vector_values
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+           413: 'Payload Too Large', 500: 'Internal Server Error',
+           503: 'Service Unavailable'}
+
+MAX_BODY = 16 * 1024 * 1024
+
+
+def _solve(request: dict) -> dict:
+    system = build_system(request['equations'],
+                           request.get('backend', 'decimal'))
+    result = format_solution(None, system.solve())
+    del result['id']
+    return result
+
+
+def _intersect(request: dict) -> dict:
+    from line import Line
+    from vector import Vector
+
+    backend = request.get('backend', 'decimal')
+    first, second = [Line(Vector(a, b, backend=backend), c)
+                     for a, b, c in request['lines']]
+
+    intersection = first.get_intersection(second)
+    if intersection is None:
+        return {'status': 'parallel'}
+    if isinstance(intersection, Line):
+        return {'status': 'coincident'}
+    return {'status': 'point', 'point': vector_values(intersection)}
+
+
+HANDLERS = {'/solve': _solve, '/intersect': _intersect}
+
+
+def process_batch(batch: List[Tuple[str, dict]]) -> List[Tuple[int, dict]]:
+    """
+    ``(status, body)`` for every ``(path, request)`` of a batch. Runs in
+    the executor. A failing request gets 400 for bad input and 500 for
+    anything else, without affecting the rest of the batch.
+
+    >>> [status for status, _ in process_batch(
+    ...     [('/solve', {'equations': [[1, 2]]}),
+    ...      ('/solve', {'equations': [['Infinity', 1, 1], [1, 1, 2]]}),
+    ...      ('/solve', {})])]
+    [200, 400, 400]
+    """
+    results = []
+    for path, request in batch:
+        try:
+            results.append((200, HANDLERS[path](request)))
+        except INPUT_ERRORS as e:
+            results.append((400, {'error': str(e) or e.__class__.__name__}))
+        except Exception as e:
+            results.append((500, {'error': str(e) or e.__class__.__name__}))
+    return results
+
+
+class ServiceStats:
+    """
+    Request counters, batch sizes and latency percentiles over the last
+    ``samples`` requests.
+    """
+
+    def __init__(self, samples: int = 10000):
+        self.started = time.monotonic()
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.batches = 0
+        self.batched_requests = 0
+        self.latencies = deque(maxlen=samples)
+
+    def record(self, status: int, latency: float):
+        if status == 200:
+            self.completed += 1
+        else:
+            self.failed += 1
+        self.latencies.append(latency)
+
+    def as_dict(self, queued: int = 0) -> dict:
+        latencies = sorted(self.latencies)
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1,
+                                 int(p * len(latencies)))]
+
+        uptime = time.monotonic() - self.started
+        return {
+            'uptime': uptime,
+            'completed': self.completed,
+            'failed': self.failed,
+            'rejected': self.rejected,
+            'queued': queued,
+            'batches': self.batches,
+            'mean_batch_size': self.batched_requests / self.batches
+            if self.batches else None,
+            'throughput': (self.completed + self.failed) / uptime,
+            'latency_p50': percentile(0.5),
+            'latency_p95': percentile(0.95),
+            'latency_p99': percentile(0.99),
+        }
+
+
+class SolveService:
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8080,
+                 window: float = 0.002, max_batch: int = 256,
+                 queue_size: int = 1024, workers: int = None,
+                 executor: Executor = None):
+        self.host = host
+        self.port = port
+        self.window = window
+        self.max_batch = max_batch
+        self.queue_size = queue_size
+        # Worker count of the executor, which also bounds the batches in
+        # flight; a given executor counts as one worker unless told otherwise
+        if workers is None:
+            workers = 1 if executor is not None else os.cpu_count() or 1
+        self.workers = workers
+        self.executor = executor
+        self._owns_executor = executor is None
+        self.stats = ServiceStats()
+        self.server = None
+        self.queue = None
+        self._batcher = None
+        self._in_flight = None
+
+    def _create_executor(self) -> Executor:
+        # Forked workers would inherit open client sockets and keep them
+        # alive after the service closed its side
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=init_worker, initargs=(getcontext().prec,))
+
+    async def start(self):
+        if self.executor is None:
+            self.executor = self._create_executor()
+        self.queue = asyncio.Queue(self.queue_size)
+        # One batch per executor worker may run while the next is collected
+        self._in_flight = asyncio.Semaphore(self.workers)
+        self._batcher = asyncio.ensure_future(self._collect_batches())
+        self.server = await asyncio.start_server(self._handle_connection,
+                                                 self.host, self.port)
+
+    async def serve_forever(self):
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+        self._batcher.cancel()
+        self.executor.shutdown()
+
+    async def _collect_batches(self):
+        loop = asyncio.get_event_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(),
+                                                        timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._in_flight.acquire()
+            asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch: list):
+        loop = asyncio.get_event_loop()
+        self.stats.batches += 1
+        self.stats.batched_requests += len(batch)
+        executor = self.executor
+        try:
+            results = await loop.run_in_executor(
+                executor, process_batch,
+                [(path, request) for path, request, _ in batch])
+        except Exception as e:
+            # A crashed worker breaks the whole pool; replace it so later
+            # batches can still be solved. Other batches that ran on the
+            # same pool fail too, only the first one replaces it
+            if isinstance(e, BrokenProcessPool) and self._owns_executor \
+                    and self.executor is executor:
+                executor.shutdown(wait=False)
+                self.executor = self._create_executor()
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(
+                        (500, {'error': str(e) or e.__class__.__name__}))
+        else:
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._in_flight.release()
+
+    async def _dispatch(self, method: str, path: str, body: bytes) \
+            -> Tuple[int, dict]:
+        if method == 'GET' and path == '/stats':
+            return 200, self.stats.as_dict(self.queue.qsize())
+        if method != 'POST' or path not in HANDLERS:
+            return 404, {'error': 'Not found'}
+
+        try:
+            request = json.loads(body, parse_float=Decimal)
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        if not isinstance(request, dict):
+            return 400, {'error': 'Request body should be a JSON object'}
+
+        future = asyncio.get_event_loop().create_future()
+        try:
+            self.queue.put_nowait((path, request, future))
+        except asyncio.QueueFull:
+            self.stats.rejected += 1
+            return 503, {'error': 'Too many pending requests'}
+        return await future
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                parts = request_line.decode('latin-1').split()
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                length = headers.get('content-length', '0')
+                start = time.monotonic()
+                if len(parts) != 3 or not length.isdigit():
+                    # The framing cannot be trusted after a bad request
+                    path = None
+                    status, body = 400, {'error': 'Malformed request'}
+                    keep_alive = False
+                elif int(length) > MAX_BODY:
+                    path = parts[1]
+                    status, body = 413, {'error': 'Request body too large'}
+                    keep_alive = False
+                else:
+                    method, path, version = parts
+                    payload = await reader.readexactly(int(length))
+                    status, body = await self._dispatch(method, path, payload)
+                    keep_alive = headers.get('connection', '').lower() != \
+                        'close' and version == 'HTTP/1.1'
+
+                if path != '/stats' and status != 404:
+                    self.stats.record(status, time.monotonic() - start)
+
+                data = json.dumps(body).encode()
+                writer.write(
+                    f'HTTP/1.1 {status} {REASONS[status]}\r\n'
+                    f'Content-Type: application/json\r\n'
+                    f'Content-Length: {len(data)}\r\n'
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}"
+                    f'\r\n\r\n'.encode() + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ValueError, ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _request(port: int, method: str, path: str, body=None) \
+        -> Tuple[int, dict]:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    data = json.dumps(body).encode() if body is not None else b''
+    writer.write(f'{method} {path} HTTP/1.1\r\nHost: localhost\r\n'
+                 f'Content-Length: {len(data)}\r\nConnection: close\r\n\r\n'
+                 .encode() + data)
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(payload)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None,
+                        help='solver processes, one per CPU by default')
+    parser.add_argument('--window', type=float, default=0.002,
+                        help='seconds to wait for more requests per batch')
+    parser.add_argument('--max-batch', type=int, default=256)
+    parser.add_argument('--queue-size', type=int, default=1024,
+                        help='pending requests before answering 503')
+    args = parser.parse_args(argv)
+
+    service = SolveService(args.host, args.port, args.window, args.max_batch,
+                           args.queue_size, args.workers)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from typing import Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from vector import Vector
+from vector_array import VectorArray
+
+METRICS = ('angle', 'dot')
+
+
+class SimilarityIndex:
+    """
+    Nearest neighbour search over a fixed set of vectors, by angle (the
+    same quantity as ``Vector.angle_to``) or by dot product.
+
+    Exact search multiplies the queries by the stored vectors one block of
+    ``block_size`` rows at a time and keeps a running top-k, so memory stays
+    bounded for large sets. With ``projections`` set, a random hyperplane
+    hash is built as well and ``approximate=True`` only re-ranks the
+    vectors that share the query's hash bucket.
+
+    >>> index = SimilarityIndex([Vector(1, 0), Vector(1, 1), Vector(0, 1),
+    ...                          Vector(-1, 0), Vector(3, 0.5)])
+    >>> [i for i, _ in index.search(Vector(2, 0), k=3)]
+    [0, 4, 1]
+    >>> index.search(Vector(1, 0), k=2, metric='dot')
+    [(4, 3.0), (0, 1.0)]
+    >>> [[i for i, _ in hits] for hits in
+    ...  index.search_many([Vector(0, 5), Vector(-1, 0.1)], k=1)]
+    [[2], [3]]
+    """
+
+    def __init__(self, vectors: Union[Iterable[Vector], VectorArray],
+                 block_size: int = 65536, projections: int = None,
+                 seed: int = 0):
+        if not isinstance(vectors, VectorArray):
+            vectors = VectorArray.from_vectors(list(vectors))
+
+        self.vectors = vectors
+        self.units = vectors.get_unit_vector()
+        self.block_size = block_size
+
+        self.planes = None
+        self.buckets: Dict[int, np.ndarray] = {}
+        if projections:
+            random = np.random.default_rng(seed)
+            self.planes = random.standard_normal(
+                (projections, vectors.dimension))
+            codes = self._hash(self.units.data)
+            order = np.argsort(codes, kind='stable')
+            values, starts = np.unique(codes[order], return_index=True)
+            for value, chunk in zip(values, np.split(order, starts[1:])):
+                self.buckets[int(value)] = chunk
+
+    def search(self, query: Vector, k: int = 1, metric: str = 'angle',
+               approximate: bool = False) -> List[Tuple[int, float]]:
+        return self.search_many([query], k, metric, approximate)[0]
+
+    def search_many(self, queries: Union[Iterable[Vector], VectorArray],
+                    k: int = 1, metric: str = 'angle',
+                    approximate: bool = False) \
+            -> List[List[Tuple[int, float]]]:
+        """
+        Top ``k`` matches for every query, best first, as
+        ``(position, score)`` pairs. The score is the angle in radians for
+        ``metric='angle'`` and the dot product for ``metric='dot'``.
+
+        >>> import random
+        >>> random.seed(1)
+        >>> vectors = [Vector(*(random.uniform(-1, 1) for _ in range(8)))
+        ...            for _ in range(500)]
+        >>> index = SimilarityIndex(vectors, projections=4)
+        >>> query = vectors[42] * 3
+        >>> index.search(query, approximate=True)[0][0]
+        42
+        """
+        assert metric in METRICS, f'metric should be one of {METRICS}'
+
+        if not isinstance(queries, VectorArray):
+            queries = VectorArray.from_vectors(list(queries),
+                                               self.vectors.dimension)
+
+        if metric == 'angle':
+            data, queries = self.units.data, queries.get_unit_vector().data
+        else:
+            data, queries = self.vectors.data, queries.data
+
+        if approximate and self.planes is not None:
+            results = [self._search_bucket(data, query, k)
+                       for query in queries]
+        else:
+            results = self._search_exact(data, queries, k)
+
+        if metric == 'angle':
+            return [[(i, float(np.arccos(np.clip(score, -1, 1))))
+                     for i, score in hits] for hits in results]
+        return [[(i, float(score)) for i, score in hits] for hits in results]
+
+    def _search_exact(self, data, queries, k):
+        best_scores = np.empty((len(queries), 0))
+        best_indices = np.empty((len(queries), 0), dtype=np.int64)
+
+        for start in range(0, len(data), self.block_size):
+            block = data[start:start + self.block_size]
+            scores = np.hstack([best_scores, queries @ block.T])
+            indices = np.hstack([best_indices, np.broadcast_to(
+                np.arange(start, start + len(block)),
+                (len(queries), len(block)))])
+
+            if scores.shape[1] > k:
+                top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = np.take_along_axis(scores, top, axis=1)
+                indices = np.take_along_axis(indices, top, axis=1)
+            best_scores, best_indices = scores, indices
+
+        order = np.argsort(-best_scores, axis=1, kind='stable')
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        best_indices = np.take_along_axis(best_indices, order, axis=1)
+
+        return [list(zip(indices.tolist(), scores.tolist()))
+                for indices, scores in zip(best_indices, best_scores)]
+
+    def _search_bucket(self, data, query, k):
+        candidates = self.buckets.get(int(self._hash(query[None])[0]))
+        if candidates is None or len(candidates) < k:
+            return self._search_exact(data, query[None], k)[0]
+
+        hits = self._search_exact(data[candidates], query[None], k)[0]
+        return [(int(candidates[i]), score) for i, score in hits]
+
+    def _hash(self, units: np.ndarray) -> np.ndarray:
+        bits = (units @ self.planes.T) >= 0
+        return bits @ (1 << np.arange(self.planes.shape[0]))
+
+    def __len__(self):
+        return len(self.vectors)
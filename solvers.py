@@ -0,0 +1,312 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from decimal import Decimal
+from fractions import Fraction
+from typing import Callable, Union
+
+import numpy as np
+
+from lu import LUFactorization, SingularMatrixException
+from matrix import AugmentedMatrix
+from tools import DECIMAL, FLOAT, FRACTION
+from vector import Vector
+
+# Exact conversion of tolerances and float corrections;
+# ``NumericBackend.convert`` would snap the tiny ones to zero
+_EXACT = {DECIMAL: Decimal, FRACTION: Fraction}
+
+
+class SolverResult:
+    """
+    Solution of an iterative or refined solve together with how it was
+    reached. ``residual_norm`` is the max-norm of ``b - Ax`` and
+    ``method`` names the path that produced ``solution``.
+    """
+
+    def __init__(self, solution, residual_norm, iterations: int,
+                 converged: bool, method: str):
+        self.solution = solution
+        self.residual_norm = residual_norm
+        self.iterations = iterations
+        self.converged = converged
+        self.method = method
+
+    def __str__(self):
+        return (f"{self.__class__.__name__}({self.solution}, "
+                f"method={self.method!r}, converged={self.converged}, "
+                f"iterations={self.iterations}, "
+                f"residual_norm={self.residual_norm})")
+
+    __repr__ = __str__
+
+
+def _max_norm(values):
+    if isinstance(values, np.ndarray) and values.dtype != object:
+        return float(np.abs(values).max(initial=0))
+    return max((abs(x) for x in values), default=0)
+
+
+def _direct(system, iterations: int) -> SolverResult:
+    solution = system.solve()
+    residual_norm = None
+    if isinstance(solution, Vector):
+        matrix = system.to_matrix()
+        coordinates = np.array(solution.coordinates, dtype=matrix.rows.dtype)
+        residual_norm = _max_norm(
+            matrix.rows[:, -1] - matrix.rows[:, :-1] @ coordinates)
+    return SolverResult(solution, residual_norm, iterations, False, 'direct')
+
+
+def refine(system, tolerance: Union[str, float, Decimal] = '1e-24',
+           max_iterations: int = 10) -> SolverResult:
+    """
+    Solve a square ``system`` with a float64 LU factorization and improve
+    the answer by iterative refinement: residuals ``b - Ax`` are computed
+    in Decimal (or exactly, for the fraction backend) and the corrections
+    are solved with the same float factorization.
+
+    Refinement stops once the residual is below ``tolerance`` relative to
+    ``|A| |x| + |b|``. When it stagnates, runs out of iterations or the
+    system is singular or not square, the system is solved by elimination
+    in the residual backend instead, Decimal for float systems, and
+    returned with ``method='direct'``.
+
+    >>> from plane import Plane
+    >>> from linesys import LinearSystem
+    >>> s = LinearSystem(Plane(Vector(0, 1, 1), 1),
+    ...                  Plane(Vector(1, -1, 1), 2),
+    ...                  Plane(Vector(1, 2, -5), 3))
+    >>> result = refine(s)
+    >>> result.method, result.converged
+    ('refinement', True)
+    >>> result.residual_norm < Decimal('1e-24')
+    True
+    >>> (result.solution - s.solve()).magnitude < Decimal('1e-25')
+    True
+    >>> refine(LinearSystem(Plane(Vector(1, 1, 1), 1),
+    ...                     Plane(Vector(2, 2, 2), 2),
+    ...                     Plane(Vector(0, 0, 1), 3))).method
+    'direct'
+    >>> s = LinearSystem(Plane(Vector(1, 0, 0), 1),
+    ...                  Plane(Vector(0, 3, 0), 1),
+    ...                  Plane(Vector(0, 0, 1), 1), backend='float')
+    >>> result = refine(s, max_iterations=0)
+    >>> result.method, result.iterations, result.solution.backend.name
+    ('direct', 0, 'decimal')
+    """
+    backend = DECIMAL if system.backend is FLOAT else system.backend
+    exact_type = _EXACT[backend]
+    tolerance = exact_type(tolerance)
+    if backend is not system.backend:
+        # Fall back to elimination in Decimal too, not in float
+        fallback = type(system)(*system.planes, backend=backend)
+    else:
+        fallback = system
+
+    exact = AugmentedMatrix.from_planes(system.planes, backend)
+    if len(exact) != exact.dimension:
+        return _direct(fallback, 0)
+
+    a, b = exact.rows[:, :-1], exact.rows[:, -1]
+    try:
+        lu = LUFactorization(AugmentedMatrix(exact.rows.astype(np.float64),
+                                             FLOAT))
+    except SingularMatrixException:
+        return _direct(fallback, 0)
+
+    scale_a = max(sum(abs(x) for x in row) for row in a)
+    scale_b = _max_norm(b)
+
+    x = np.array([exact_type(v) for v in
+                  lu.solve_array(b.astype(np.float64))], dtype=object)
+    previous = None
+    iteration = 0
+    for iteration in range(1, max_iterations + 1):
+        residual = b - a @ x
+        norm = _max_norm(residual)
+
+        if norm <= tolerance * (scale_a * _max_norm(x) + scale_b):
+            return SolverResult(Vector(*x, backend=system.backend), norm,
+                                iteration, True, 'refinement')
+        if previous is not None and norm * 2 > previous:
+            break
+        previous = norm
+
+        correction = lu.solve_array(residual.astype(np.float64))
+        x += np.array([exact_type(v) for v in correction], dtype=object)
+
+    return _direct(fallback, iteration)
+
+
+def _prepare(system, tolerance, initial: Union[Vector, None]):
+    matrix = system.to_matrix()
+    assert len(matrix) == matrix.dimension, \
+        'Iterative solvers need a square coefficient matrix'
+
+    a, b = matrix.rows[:, :-1], matrix.rows[:, -1]
+    if initial is None:
+        x = np.zeros_like(b)
+        x[:] = system.backend.convert(0)
+    else:
+        assert initial.dimension == system.dimension
+        x = np.array(initial.to_backend(system.backend).coordinates,
+                     dtype=b.dtype)
+
+    # |b| alone is 0 for homogeneous systems, which no warm start can reach
+    scale = max(_max_norm(b), _max_norm(np.abs(a).sum(axis=1)) * _max_norm(x))
+
+    tolerance = _EXACT.get(system.backend, float)(tolerance)
+    return a, b, x, tolerance * scale
+
+
+def _diagonal(a: np.ndarray) -> np.ndarray:
+    diagonal = a.diagonal().copy()
+    for i, value in enumerate(diagonal):
+        if value == 0:
+            raise SingularMatrixException(f'Zero on the diagonal at row {i}')
+    return diagonal
+
+
+def _result(system, x, residual, iterations, converged, method):
+    return SolverResult(Vector(*x, backend=system.backend),
+                        _max_norm(residual), iterations, converged, method)
+
+
+def jacobi(system, tolerance: Union[str, float] = '1e-10',
+           max_iterations: int = 1000, initial: Vector = None) \
+        -> SolverResult:
+    """
+    Jacobi iteration, converges for strictly diagonally dominant systems.
+    Stops once the max-norm of ``b - Ax`` is below ``tolerance`` times the
+    larger of ``|b|`` and ``|A| |initial|``. ``initial`` warm-starts from
+    an earlier solution.
+
+    >>> from plane import Plane
+    >>> from linesys import LinearSystem
+    >>> s = LinearSystem(Plane(Vector(4, 1, 0), 1),
+    ...                  Plane(Vector(1, 4, 1), 2),
+    ...                  Plane(Vector(0, 1, 4), 3), backend='float')
+    >>> r = jacobi(s)
+    >>> r.converged, [round(x, 6) for x in r.solution]
+    (True, [0.178571, 0.285714, 0.678571])
+    >>> jacobi(s, initial=r.solution).iterations
+    0
+    >>> homogeneous = LinearSystem(Plane(Vector(4, 1, 0), 0),
+    ...                            Plane(Vector(1, 4, 1), 0),
+    ...                            Plane(Vector(0, 1, 4), 0))
+    >>> r = jacobi(homogeneous, initial=Vector(1, 1, 1))
+    >>> r.converged, r.iterations < 50
+    (True, True)
+    """
+    a, b, x, threshold = _prepare(system, tolerance, initial)
+    diagonal = _diagonal(a)
+
+    for iteration in range(max_iterations + 1):
+        residual = b - a @ x
+        if _max_norm(residual) <= threshold:
+            return _result(system, x, residual, iteration, True, 'jacobi')
+        if iteration == max_iterations:
+            break
+        x = x + residual / diagonal
+
+    return _result(system, x, residual, max_iterations, False, 'jacobi')
+
+
+def gauss_seidel(system, tolerance: Union[str, float] = '1e-10',
+                 max_iterations: int = 1000, initial: Vector = None,
+                 omega: Union[str, float] = 1) -> SolverResult:
+    """
+    Gauss-Seidel iteration, or successive over-relaxation when ``omega``
+    is not 1. Converges for diagonally dominant and for symmetric
+    positive-definite systems (with ``0 < omega < 2``).
+
+    >>> from plane import Plane
+    >>> from linesys import LinearSystem
+    >>> s = LinearSystem(Plane(Vector(4, 1, 0), 1),
+    ...                  Plane(Vector(1, 4, 1), 2),
+    ...                  Plane(Vector(0, 1, 4), 3))
+    >>> r = gauss_seidel(s)
+    >>> r.method, r.converged, r.iterations < jacobi(s).iterations
+    ('gauss-seidel', True, True)
+    >>> gauss_seidel(s, omega='1.1').method
+    'sor'
+    """
+    a, b, x, threshold = _prepare(system, tolerance, initial)
+    diagonal = _diagonal(a)
+    omega = system.backend.convert(omega)
+    method = 'gauss-seidel' if omega == 1 else 'sor'
+    n = len(b)
+
+    for iteration in range(max_iterations + 1):
+        residual = b - a @ x
+        if _max_norm(residual) <= threshold:
+            return _result(system, x, residual, iteration, True, method)
+        if iteration == max_iterations:
+            break
+        for i in range(n):
+            x[i] += omega * (b[i] - a[i] @ x) / diagonal[i]
+
+    return _result(system, x, residual, max_iterations, False, method)
+
+
+def conjugate_gradient(system, tolerance: Union[str, float] = '1e-10',
+                       max_iterations: int = None, initial: Vector = None,
+                       preconditioner: Union[str, Callable] = None) \
+        -> SolverResult:
+    """
+    Conjugate gradient method for symmetric positive-definite systems.
+    ``preconditioner`` is ``'jacobi'`` for diagonal scaling, or a callable
+    applying ``M^-1`` to a residual array. Without ``max_iterations`` it
+    runs at most ``2 * dimension`` steps.
+
+    >>> from plane import Plane
+    >>> from linesys import LinearSystem
+    >>> s = LinearSystem(Plane(Vector(4, 1, 0), 1),
+    ...                  Plane(Vector(1, 4, 1), 2),
+    ...                  Plane(Vector(0, 1, 4), 3), backend='fraction')
+    >>> conjugate_gradient(s)
+    SolverResult(Vector(5/28, 2/7, 19/28), method='cg', converged=True, \
+iterations=3, residual_norm=0)
+    >>> conjugate_gradient(s, preconditioner='jacobi').iterations
+    3
+    """
+    a, b, x, threshold = _prepare(system, tolerance, initial)
+    if max_iterations is None:
+        max_iterations = 2 * len(b)
+
+    if preconditioner is None:
+        precondition = None
+    elif preconditioner == 'jacobi':
+        diagonal = _diagonal(a)
+        precondition = lambda r: r / diagonal
+    else:
+        precondition = preconditioner
+
+    residual = b - a @ x
+    z = residual if precondition is None else precondition(residual)
+    direction = z.copy()
+    rz = residual @ z
+
+    for iteration in range(max_iterations + 1):
+        if _max_norm(residual) <= threshold:
+            return _result(system, x, residual, iteration, True, 'cg')
+        if iteration == max_iterations:
+            break
+
+        product = a @ direction
+        alpha = rz / (direction @ product)
+        x = x + alpha * direction
+        residual = residual - alpha * product
+
+        z = residual if precondition is None else precondition(residual)
+        rz, previous = residual @ z, rz
+        direction = z + (rz / previous) * direction
+
+    return _result(system, x, residual, max_iterations, False, 'cg')
+
+
+ITERATIVE_METHODS = {
+    'jacobi': jacobi,
+    'gauss-seidel': gauss_seidel,
+    'cg': conjugate_gradient,
+}
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+import heapq
+from typing import Dict, Iterable, List, Tuple, Union
+
+from linesys import LinearSystem, Parametrization
+from hyperplane import Hyperplane
+from tools import NumericBackend, get_backend
+from vector import Vector
+
+
+class SparseLinearSystem:
+    """
+    Linear system that stores every equation as a ``{column: coefficient}``
+    dict plus a constant term, so memory and elimination time scale with
+    the number of nonzero coefficients.
+
+    Elimination picks pivots by the Markowitz criterion, the entry with the
+    smallest ``(row_count - 1) * (column_count - 1)`` among the few
+    sparsest columns, which keeps fill-in low. Entries smaller than
+    ``threshold`` times the largest one in their column are never used as
+    pivots, to keep the elimination stable.
+
+    >>> s = SparseLinearSystem(3, [({1: 1, 2: 1}, 1),
+    ...                            ({0: 1, 1: -1, 2: 1}, 2),
+    ...                            ({0: 1, 1: 2, 2: -5}, 3)])
+    >>> s.solve()
+    Vector(2.55555555555555555555555555556, \
+0.777777777777777777777777777778, 0.222222222222222222222222222222)
+    >>> s.nonzero_count
+    8
+    """
+
+    def __init__(self,
+                 dimension: int,
+                 rows: Iterable[Tuple[Dict[int, float], float]],
+                 backend: Union[str, NumericBackend] = None,
+                 threshold: float = 0.1):
+        self.dimension = dimension
+        self.backend = get_backend(backend)
+        self.threshold = threshold
+
+        convert = self.backend.convert
+        is_zero = self.backend.is_zero
+
+        self.rows: List[Dict[int, float]] = []
+        self.constants = []
+        for coefficients, constant in rows:
+            row = {}
+            for j, value in coefficients.items():
+                assert 0 <= j < dimension, \
+                    'All equations in the system should live in the ' \
+                    'same dimension'
+                value = convert(value)
+                if not is_zero(value):
+                    row[j] = value
+            self.rows.append(row)
+            self.constants.append(convert(constant))
+
+    @classmethod
+    def from_linear_system(cls, system: LinearSystem,
+                           threshold: float = 0.1) -> 'SparseLinearSystem':
+        return cls(system.dimension,
+                   [(dict(enumerate(p.normal_vector)), p.constant_term)
+                    for p in system],
+                   backend=system.backend, threshold=threshold)
+
+    def to_linear_system(self, plane_type=Hyperplane) -> LinearSystem:
+        """
+        >>> SparseLinearSystem(3, [({0: 1, 2: 4}, 5)]).to_linear_system()[0]
+        Hyperplane(Vector(1, 0, 4), 5)
+        """
+        planes = []
+        for row, constant in zip(self.rows, self.constants):
+            coordinates = [0] * self.dimension
+            for j, value in row.items():
+                coordinates[j] = value
+            planes.append(plane_type(Vector(*coordinates,
+                                            backend=self.backend),
+                                     constant))
+        return LinearSystem(*planes, backend=self.backend)
+
+    @property
+    def nonzero_count(self) -> int:
+        return sum(len(row) for row in self.rows)
+
+    def solve(self) -> Union[Vector, Parametrization, None]:
+        """
+        Same results as ``LinearSystem.solve`` on the dense form.
+
+        >>> s = SparseLinearSystem(3, [({0: 1, 1: 1, 2: 1}, 1),
+        ...                            ({0: 1, 1: 1, 2: 1}, 2)])
+        >>> print(s.solve())
+        None
+        >>> s = SparseLinearSystem(3, [({0: 1, 1: 1, 2: 1}, 1),
+        ...                            ({1: 1}, 2)], backend='fraction')
+        >>> print(s.solve())
+        [x_0, x_1, x_2] = Vector(-1, 2, 0) + x_2 * Vector(-1, 0, 1)
+        >>> print(s.to_linear_system().solve())
+        [x_0, x_1, x_2] = Vector(-1, 2, 0) + x_2 * Vector(-1, 0, 1)
+        """
+        pivots = self._eliminate()
+        if pivots is None:
+            return None
+
+        rows, constants, order = pivots
+        pivot_columns = {c for _, c in order}
+
+        basepoint = self._back_substitute(rows, constants, order, {})
+        if len(pivot_columns) == self.dimension:
+            return Vector(*basepoint, backend=self.backend)
+
+        zero = self.backend.convert(0)
+        null_basis = [
+            self._back_substitute(rows, [zero] * len(constants), order, {f: 1})
+            for f in range(self.dimension) if f not in pivot_columns]
+        free_columns = self._reduce_from_right(null_basis)
+
+        # Free variables are zero at the basepoint, like in the RREF
+        for f, direction in zip(free_columns, null_basis):
+            value = basepoint[f]
+            if value:
+                basepoint = [x - value * d
+                             for x, d in zip(basepoint, direction)]
+
+        directions = [[zero] * self.dimension for _ in range(self.dimension)]
+        for f, direction in zip(free_columns, null_basis):
+            directions[f] = direction
+
+        return Parametrization(
+            Vector(*basepoint, backend=self.backend),
+            [Vector(*d, backend=self.backend) for d in directions])
+
+    def _reduce_from_right(self, vectors: List[list]) -> List[int]:
+        """
+        Reduce null space ``vectors`` in place so that each one ends with a
+        1 at its own column and the others are 0 there. These columns are
+        the free variables of the reduced row echelon form, and the reduced
+        vectors are its direction vectors. Returns the columns.
+        """
+        is_zero = self.backend.is_zero
+        columns = []
+        for k, vector in enumerate(vectors):
+            f = max(j for j, x in enumerate(vector) if not is_zero(x))
+            vectors[k] = vector = [x / vector[f] for x in vector]
+            for other in range(len(vectors)):
+                if other != k and not is_zero(vectors[other][f]):
+                    factor = vectors[other][f]
+                    vectors[other] = [a - factor * b for a, b in
+                                      zip(vectors[other], vector)]
+            columns.append(f)
+
+        return columns
+
+    def _back_substitute(self, rows, constants, order, free_values):
+        x = [self.backend.convert(0)] * self.dimension
+        for j, value in free_values.items():
+            x[j] = self.backend.convert(value)
+
+        for r, c in reversed(order):
+            row = rows[r]
+            total = constants[r]
+            for j, value in row.items():
+                if j != c:
+                    total -= value * x[j]
+            x[c] = total / row[c]
+
+        return x
+
+    def _eliminate(self):
+        """
+        Markowitz elimination on a copy of the rows. Returns the reduced
+        rows, constants and the ``(row, column)`` pivot sequence, or
+        ``None`` when the system is inconsistent.
+        """
+        is_zero = self.backend.is_zero
+        rows = [dict(row) for row in self.rows]
+        constants = list(self.constants)
+
+        columns: Dict[int, set] = {}
+        for i, row in enumerate(rows):
+            for j in row:
+                columns.setdefault(j, set()).add(i)
+
+        heap = [(len(r), j) for j, r in columns.items()]
+        heapq.heapify(heap)
+
+        order = []
+        active = set(range(len(rows)))
+
+        while heap:
+            pivot = self._choose_pivot(rows, columns, heap)
+            if pivot is None:
+                break
+            r, c = pivot
+            order.append(pivot)
+            active.discard(r)
+
+            pivot_row = rows[r]
+            for j in pivot_row:
+                columns[j].discard(r)
+
+            for i in list(columns[c]):
+                row = rows[i]
+                factor = row.pop(c) / pivot_row[c]
+                for j, value in pivot_row.items():
+                    if j == c:
+                        continue
+                    new = row.get(j, 0) - factor * value
+                    if is_zero(new):
+                        if j in row:
+                            del row[j]
+                            columns[j].discard(i)
+                    else:
+                        if j not in row:
+                            columns[j].add(i)
+                        row[j] = new
+                constants[i] -= factor * constants[r]
+
+            del columns[c]
+            for j in pivot_row:
+                if j in columns:
+                    heapq.heappush(heap, (len(columns[j]), j))
+
+        for i in active:
+            if not rows[i] and not is_zero(constants[i]):
+                return None
+
+        return rows, constants, order
+
+    def _choose_pivot(self, rows, columns, heap, search_columns: int = 4):
+        candidates = []
+        while heap and len(candidates) < search_columns:
+            count, j = heapq.heappop(heap)
+            if j not in columns or len(columns[j]) != count or not count:
+                continue
+            candidates.append((count, j))
+
+        threshold = self.backend.convert(self.threshold)
+        best = None
+        for count, j in candidates:
+            heapq.heappush(heap, (count, j))
+
+            largest = max(abs(rows[i][j]) for i in columns[j])
+            for i in columns[j]:
+                value = rows[i][j]
+                if abs(value) < threshold * largest:
+                    continue
+                cost = (len(rows[i]) - 1) * (count - 1)
+                if best is None or cost < best[0]:
+                    best = (cost, i, j)
+
+        if best is not None:
+            return best[1], best[2]
+
+    def __len__(self):
+        return len(self.rows)
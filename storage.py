@@ -0,0 +1,186 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+"""
+Binary files of vectors, lines, planes and linear systems.
+
+A file is the magic bytes, the length of a JSON header, the header itself
+padded to a 64 byte boundary, and one C-ordered 2D payload with a row per
+object. Float backend values are stored as little-endian float64; Decimal
+and Fraction values as fixed width ASCII strings, so they round-trip
+exactly. The payload is opened with ``numpy.memmap``, so opening a file of
+any size reads only the header and slicing reads only the rows asked for.
+
+>>> import os, tempfile
+>>> from plane import Plane
+>>> path = os.path.join(tempfile.mkdtemp(), 'vectors.vec')
+>>> save(path, [Vector(1, 2, 3), Vector('0.1', 0, -4)])
+>>> load(path)
+[Vector(1, 2, 3), Vector(0.1, 0, -4)]
+>>> save(path, LinearSystem(
+...     Plane(Vector(1, 2, 3, backend='fraction'), 4),
+...     Plane(Vector(0, 1, 0, backend='fraction'), '1/3')))
+>>> print(load(path))
+Linear System:
+Equation 1: Plane(Vector(1, 2, 3), 4)
+Equation 2: Plane(Vector(0, 1, 0), 1/3)
+"""
+import json
+import struct
+from typing import Iterable, List, Union
+
+import numpy as np
+
+from hyperplane import Hyperplane
+from line import Line
+from linesys import LinearSystem
+from plane import Plane
+from tools import FLOAT, get_backend
+from vector import Vector
+from vector_array import VectorArray
+
+MAGIC = b'VECSTORE'
+VERSION = 1
+ALIGNMENT = 64
+
+KINDS = {'vector': Vector, 'hyperplane': Hyperplane, 'line': Line,
+         'plane': Plane}
+
+
+class StorageException(Exception):
+    """"""
+
+
+def _kind_of(item) -> str:
+    for kind, cls in KINDS.items():
+        if type(item) is cls:
+            return kind
+    raise StorageException(f'Cannot store {type(item).__name__}')
+
+
+def _row(item) -> list:
+    if isinstance(item, Vector):
+        return list(item.coordinates)
+    return list(item.normal_vector.coordinates) + [item.constant_term]
+
+
+def save(path: str, items: Union[LinearSystem, Vector, Hyperplane,
+                                 Iterable[Union[Vector, Hyperplane]]]):
+    """
+    Write ``items`` to ``path``. All items must be of one type and one
+    backend; a ``LinearSystem`` is stored whole and loads back as one.
+    """
+    system = isinstance(items, LinearSystem)
+    if isinstance(items, (Vector, Hyperplane)):
+        items = [items]
+    items = list(items)
+    if not items:
+        raise StorageException('Nothing to store')
+
+    kind = _kind_of(items[0])
+    backend = items[0].backend
+    for item in items[1:]:
+        if type(item) is not type(items[0]) or item.backend is not backend:
+            raise StorageException(
+                'All items should share one type and one backend')
+
+    rows = [_row(item) for item in items]
+    if backend is FLOAT:
+        payload = np.array(rows, dtype='<f8')
+    else:
+        payload = np.array([[str(x) for x in row] for row in rows],
+                           dtype=np.bytes_)
+
+    header = json.dumps({
+        'version': VERSION,
+        'kind': kind,
+        'system': system,
+        'backend': backend.name,
+        'dtype': payload.dtype.str,
+        'shape': payload.shape,
+    }).encode()
+    offset = len(MAGIC) + 4 + len(header)
+    header += b' ' * (-offset % ALIGNMENT)
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<I', len(header)))
+        f.write(header)
+        f.write(np.ascontiguousarray(payload).tobytes())
+
+
+class Store:
+    """
+    Memory-mapped view of a file written by ``save``. Indexing builds the
+    requested objects only.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'vectors.vec')
+    >>> save(path, [Vector(i, -i, backend='float') for i in range(1000)])
+    >>> store = Store(path)
+    >>> len(store), store[999]
+    (1000, Vector(999.0, -999.0))
+    >>> store[1:3]
+    [Vector(1.0, -1.0), Vector(2.0, -2.0)]
+    >>> store.to_vector_array().data.shape
+    (1000, 2)
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise StorageException(f'{path} is not a vector store file')
+            size, = struct.unpack('<I', f.read(4))
+            header = json.loads(f.read(size).decode())
+
+        if header['version'] != VERSION:
+            raise StorageException(
+                f"Unsupported version {header['version']}")
+
+        self.kind = header['kind']
+        self.system = header['system']
+        self.backend = get_backend(header['backend'])
+        self.array = np.memmap(path, dtype=np.dtype(header['dtype']),
+                               mode='r', offset=len(MAGIC) + 4 + size,
+                               shape=tuple(header['shape']))
+
+    def _build(self, row):
+        if self.backend is FLOAT:
+            values = row.tolist()
+        else:
+            values = [x.decode() for x in row.tolist()]
+
+        if self.kind == 'vector':
+            return Vector(*values, backend=self.backend)
+        return KINDS[self.kind](Vector(*values[:-1], backend=self.backend),
+                                values[-1])
+
+    def to_vector_array(self) -> VectorArray:
+        """
+        Float vector stores as a ``VectorArray``, reading the whole payload.
+        """
+        if self.kind != 'vector' or self.backend is not FLOAT:
+            raise StorageException(
+                'Only float vector stores convert to VectorArray')
+        return VectorArray(np.array(self.array))
+
+    def to_linear_system(self) -> LinearSystem:
+        return LinearSystem(*self, backend=self.backend)
+
+    def __len__(self):
+        return self.array.shape[0]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._build(row) for row in self.array[i]]
+        return self._build(self.array[i])
+
+    def __iter__(self):
+        for row in self.array:
+            yield self._build(row)
+
+
+def load(path: str) -> Union[LinearSystem, List[Union[Vector, Hyperplane]]]:
+    store = Store(path)
+    if store.system:
+        return store.to_linear_system()
+    return list(store)
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3.6
 # -*- coding: utf-8 -*-
-from typing import Iterable
+import math
+from typing import Iterable, Union
 
 from decimal import Decimal
+from fractions import Fraction
 
 
 def is_zero(val: int) -> bool:
@@ -10,13 +12,146 @@ def is_zero(val: int) -> bool:
 
 
 def to_decimal(val) -> Decimal:
-    res = Decimal(val)
+    if isinstance(val, Fraction):
+        res = Decimal(val.numerator) / Decimal(val.denominator)
+    else:
+        res = Decimal(val)
     if is_zero(res):
         res = Decimal('0')
     return res
 
 
-def first_nonzero_index(iterable: Iterable) -> int:
+KEY_DIGITS = 9
+
+
+def round_key(values: Iterable, digits: int = KEY_DIGITS) -> tuple:
+    """
+    Hashable key of ``values`` rounded to ``digits`` decimal places, equal
+    for values of any backend that agree within the rounding.
+
+    >>> round_key([Decimal(1) / 3, 1 / 3, Fraction(1, 3), Decimal('-0')])
+    (0.333333333, 0.333333333, 0.333333333, 0.0)
+    """
+    # Adding 0.0 turns -0.0 into 0.0
+    return tuple(round(float(x), digits) + 0.0 for x in values)
+
+
+def first_nonzero_index(iterable: Iterable,
+                        backend: 'NumericBackend' = None) -> int:
+    check = is_zero if backend is None else backend.is_zero
     for k, item in enumerate(iterable):
-        if not is_zero(item):
+        if not check(item):
             return k
+
+
+class NumericBackend:
+    """
+    Number type used for coordinates and constant terms.
+
+    Every value entering a ``Vector``, ``Line``, ``Plane`` or
+    ``LinearSystem`` goes through ``convert`` of the object's backend, and
+    every zero test goes through ``is_zero``.
+    """
+
+    name = None
+
+    def convert(self, val):
+        raise NotImplementedError
+
+    is_zero = staticmethod(is_zero)
+
+    def sqrt(self, val):
+        raise NotImplementedError
+
+    def __reduce__(self):
+        # Keep backends singletons across pickling (e.g. process pools)
+        return get_backend, (self.name,)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+
+class DecimalBackend(NumericBackend):
+    """
+    >>> DECIMAL.convert('0.1') + DECIMAL.convert(1)
+    Decimal('1.1')
+    >>> DECIMAL.sqrt('2.25')
+    Decimal('1.5')
+    """
+
+    name = 'decimal'
+
+    def convert(self, val) -> Decimal:
+        return to_decimal(val)
+
+    def sqrt(self, val) -> Decimal:
+        return self.convert(val).sqrt()
+
+
+class FloatBackend(NumericBackend):
+    """
+    >>> FLOAT.convert('0.5') + FLOAT.convert(1)
+    1.5
+    >>> FLOAT.convert(1e-12)
+    0.0
+    """
+
+    name = 'float'
+
+    def convert(self, val) -> float:
+        res = float(val)
+        if is_zero(res):
+            res = 0.0
+        return res
+
+    def sqrt(self, val) -> float:
+        return math.sqrt(val)
+
+
+class FractionBackend(NumericBackend):
+    """
+    Exact rational arithmetic, zero tests are exact as well.
+
+    >>> FRACTION.convert('0.1') * 3
+    Fraction(3, 10)
+    >>> FRACTION.is_zero(FRACTION.convert('1e-20'))
+    False
+    """
+
+    name = 'fraction'
+
+    def convert(self, val) -> Fraction:
+        if isinstance(val, Fraction):
+            return val
+        return Fraction(val)
+
+    def is_zero(self, val) -> bool:
+        return val == 0
+
+    def sqrt(self, val) -> Fraction:
+        val = self.convert(val)
+        root = (Decimal(val.numerator) / Decimal(val.denominator)).sqrt()
+        return Fraction(root)
+
+
+DECIMAL = DecimalBackend()
+FLOAT = FloatBackend()
+FRACTION = FractionBackend()
+
+BACKENDS = {backend.name: backend for backend in (DECIMAL, FLOAT, FRACTION)}
+
+
+def get_backend(backend: Union[str, NumericBackend, None]) -> NumericBackend:
+    """
+    >>> get_backend('float')
+    FloatBackend()
+    >>> get_backend(FRACTION)
+    FractionBackend()
+    >>> get_backend(None)
+    DecimalBackend()
+    """
+    if backend is None:
+        return DECIMAL
+    if isinstance(backend, NumericBackend):
+        return backend
+    return BACKENDS[backend]
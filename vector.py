@@ -2,22 +2,95 @@
 # -*- coding: utf-8 -*-
 import math
 from decimal import Decimal, getcontext
+from fractions import Fraction
 from typing import Union, Tuple
 
-from tools import is_zero, to_decimal
+import instrumentation
+from tools import (DECIMAL, FLOAT, KEY_DIGITS, NumericBackend, get_backend,
+                   round_key)
 
 getcontext().prec = 30
 
 
+def _restore_vector(coordinates, backend) -> 'Vector':
+    return Vector(*coordinates, backend=backend)
+
+
 class Vector:
+    """
+    Immutable vector. Magnitude, unit vector and hash are computed on first
+    use and cached on the instance.
+
+    >>> v = Vector(1, 2)
+    >>> v.coordinates = (3, 4)
+    Traceback (most recent call last):
+    ...
+    AttributeError: Vector is immutable
+    >>> len({Vector(1, 2), Vector(1, 2), Vector(2, 1)})
+    2
+    """
+
+    __slots__ = ('coordinates', 'dimension', 'backend',
+                 '_magnitude', '_unit_vector', '_hash')
 
     precision = None
 
-    def __init__(self, *coordinates: Union[float, str]):
+    default_backend = DECIMAL
+
+    def __init__(self, *coordinates: Union[float, str],
+                 backend: Union[str, NumericBackend] = None):
+
+        if backend is None:
+            backend = self.default_backend
+        else:
+            backend = get_backend(backend)
+
+        convert = backend.convert
+        coordinates = tuple([convert(x) for x in coordinates])
+
+        setattr_ = object.__setattr__
+        setattr_(self, 'backend', backend)
+        setattr_(self, 'coordinates', coordinates)
+        setattr_(self, 'dimension', len(coordinates))
+
+        if instrumentation.ACTIVE is not None:
+            instrumentation.ACTIVE.count('vectors')
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+    __delattr__ = __setattr__
+
+    def __reduce__(self):
+        return _restore_vector, (self.coordinates, self.backend)
 
-        self.coordinates = tuple([to_decimal(x) for x in coordinates])
+    def __copy__(self):
+        return self
 
-        self.dimension = len(self.coordinates)
+    def __deepcopy__(self, memo):
+        return self
+
+    def lazy(self) -> 'LazyVector':
+        """
+        Start a fused expression, see ``lazy.LazyVector``.
+
+        >>> (Vector(1, 2).lazy() * 3 + Vector(1, 1)).evaluate()
+        Vector(4, 7)
+        """
+        from lazy import LazyVector
+        return LazyVector(self)
+
+    def to_backend(self, backend: Union[str, NumericBackend]) -> 'Vector':
+        """
+        >>> Vector(1, '0.5').to_backend('float')
+        Vector(1.0, 0.5)
+        >>> Vector(1, '0.5').to_backend('fraction')
+        Vector(1, 1/2)
+        """
+        backend = get_backend(backend)
+        if backend is self.backend:
+            return self
+        return Vector(*self.coordinates, backend=backend)
 
     @property
     def magnitude(self) -> Decimal:
@@ -26,8 +99,18 @@ class Vector:
         Decimal('5')
         >>> Vector(5, 12).magnitude
         Decimal('13')
+        >>> Vector(3, 4, backend='float').magnitude
+        5.0
         """
-        return Decimal.sqrt(sum(map(lambda x: x * x, self.coordinates)))
+        try:
+            return self._magnitude
+        except AttributeError:
+            pass
+
+        magnitude = self.backend.sqrt(
+            sum(map(lambda x: x * x, self.coordinates)))
+        object.__setattr__(self, '_magnitude', magnitude)
+        return magnitude
 
     def get_unit_vector(self) -> 'Vector':
         """
@@ -35,10 +118,23 @@ class Vector:
         True
         >>> abs(Vector(5, -4).get_unit_vector().magnitude - 1) < 0.000001
         True
+        >>> v = Vector(3, 4)
+        >>> v.get_unit_vector() is v.get_unit_vector()
+        True
         """
-        if self.magnitude == 0:
-            return Vector(*([0] * self.dimension))
-        return self / self.magnitude
+        try:
+            return self._unit_vector
+        except AttributeError:
+            pass
+
+        magnitude = self.magnitude
+        if magnitude == 0:
+            unit_vector = Vector(*([0] * self.dimension), backend=self.backend)
+        else:
+            unit_vector = self / magnitude
+
+        object.__setattr__(self, '_unit_vector', unit_vector)
+        return unit_vector
 
     def angle_to(self, other: 'Vector') -> Decimal:
         """
@@ -54,7 +150,9 @@ class Vector:
         assert self.dimension == other.dimension
 
         product = self.get_unit_vector() * other.get_unit_vector()
-        return to_decimal(math.acos(product))
+        # Rounding may push the product of unit vectors slightly past 1
+        product = max(-1, min(1, product))
+        return self.backend.convert(math.acos(product))
 
     def is_parallel(self, other: 'Vector') -> bool:
         """
@@ -68,9 +166,12 @@ class Vector:
         True
         >>> Vector(0, 2).is_parallel(Vector(2, 4))
         False
-
+        >>> Vector(0.1, 0.3, backend='float').is_parallel(
+        ...     Vector(0.3, 0.9, backend='float'))
+        True
         """
         assert self.dimension == other.dimension
+        other = other.to_backend(self.backend)
 
         if not any(self.coordinates):
             return True
@@ -93,7 +194,7 @@ class Vector:
                 k = self_x / other_x
                 continue
 
-            if self_x / other_x != k:
+            if not self.backend.is_zero(self_x / other_x - k):
                 return False
 
         return True
@@ -108,8 +209,11 @@ class Vector:
         True
         >>> Vector(2, 4).is_orthogonal(Vector(0, 0))
         True
+        >>> Vector(0.1, 0.2, backend='float').is_orthogonal(
+        ...     Vector(0.2, -0.1, backend='float'))
+        True
         """
-        return self * other == 0
+        return self.backend.is_zero(self * other)
 
     def project_on(self, other: 'Vector') -> Tuple['Vector', 'Vector']:
         """
@@ -139,12 +243,13 @@ class Vector:
         assert self.dimension == other.dimension == 3
 
         x1, y1, z1 = self.coordinates
-        x2, y2, z2 = other.coordinates
+        x2, y2, z2 = other.to_backend(self.backend).coordinates
 
         return Vector(
             y1 * z2 - y2 * z1,
             x2 * z1 - x1 * z2,
-            x1 * y2 - x2 * y1
+            x1 * y2 - x2 * y1,
+            backend=self.backend
         )
 
     def __bool__(self):
@@ -165,8 +270,55 @@ class Vector:
         >>> Vector(1, 2) == Vector(1, 2, 3)
         False
         """
+        if not isinstance(other, Vector):
+            return NotImplemented
         return self.coordinates == other.coordinates
 
+    def canonical_key(self, digits: int = KEY_DIGITS) -> tuple:
+        """
+        Coordinates rounded to ``digits`` places, for grouping vectors that
+        are equal up to rounding noise or live in different backends.
+
+        >>> Vector('0.1', '0.2').canonical_key() == \\
+        ...     Vector(0.1, 0.2, backend='float').canonical_key()
+        True
+        """
+        return round_key(self.coordinates, digits)
+
+    def direction_key(self, digits: int = KEY_DIGITS) -> Union[tuple, None]:
+        """
+        Key shared by all vectors parallel to this one: the rounded unit
+        vector, with the sign flipped so that its first nonzero coordinate
+        is positive. Zero vectors, parallel to everything, have no key.
+
+        >>> Vector(1, 2).direction_key() == Vector(-2, -4).direction_key()
+        True
+        >>> Vector(1, 2).direction_key() == Vector(2, 5).direction_key()
+        False
+        >>> print(Vector(0, 0).direction_key())
+        None
+        """
+        if not self:
+            return None
+
+        key = round_key(self.get_unit_vector(), digits)
+        for x in key:
+            if x:
+                if x < 0:
+                    key = tuple(-x + 0.0 for x in key)
+                break
+        return key
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+
+        value = hash(self.coordinates)
+        object.__setattr__(self, '_hash', value)
+        return value
+
     def __add__(self, other: 'Vector') -> 'Vector':
         """
         >>> Vector(1, 2) + Vector(2, 3)
@@ -177,11 +329,17 @@ class Vector:
         Traceback (most recent call last):
         ...
         AssertionError
+        >>> Vector(1, 2, backend='float') + Vector('0.5', '0.5')
+        Vector(1.5, 2.5)
         """
+        if not isinstance(other, Vector):
+            return NotImplemented
         assert self.dimension == other.dimension
+        other = other.to_backend(self.backend)
 
         return Vector(*map(sum,
-                           zip(self.coordinates, other.coordinates)))
+                           zip(self.coordinates, other.coordinates)),
+                      backend=self.backend)
 
     def __sub__(self, other: 'Vector') -> 'Vector':
         """
@@ -194,10 +352,14 @@ class Vector:
         ...
         AssertionError
         """
+        if not isinstance(other, Vector):
+            return NotImplemented
         assert self.dimension == other.dimension
+        other = other.to_backend(self.backend)
 
         return Vector(*map(lambda x: x[0] - x[1],
-                           zip(self.coordinates, other.coordinates)))
+                           zip(self.coordinates, other.coordinates)),
+                      backend=self.backend)
 
     def __mul__(self, other: Union[float, 'Vector']) \
             -> Union['Vector', Decimal]:
@@ -217,16 +379,17 @@ class Vector:
         """
         if isinstance(other, Vector):
             assert self.dimension == other.dimension
+            other = other.to_backend(self.backend)
 
             return sum(map(lambda x: x[0] * x[1],
                            zip(self.coordinates, other.coordinates)))
-        elif isinstance(other, (int, float, Decimal)):
+        elif isinstance(other, (int, float, Decimal, Fraction)):
 
-            other = to_decimal(other)
-            return Vector(*map(lambda x: x * other, self.coordinates))
+            other = self.backend.convert(other)
+            return Vector(*map(lambda x: x * other, self.coordinates),
+                          backend=self.backend)
 
-        else:
-            raise AssertionError
+        return NotImplemented
 
     def __rmul__(self, other: float) -> 'Vector':
         """
@@ -239,17 +402,39 @@ class Vector:
         """
         >>> Vector(4, 5) / 2
         Vector(2, 2.5)
+        >>> Vector(1, 2, backend='fraction') / 3
+        Vector(1/3, 2/3)
         """
 
-        assert isinstance(other, (int, float, Decimal))
+        assert isinstance(other, (int, float, Decimal, Fraction))
 
-        other = to_decimal(other)
+        other = self.backend.convert(other)
 
-        return Vector(*map(lambda x: x / other, self.coordinates))
+        return Vector(*map(lambda x: x / other, self.coordinates),
+                      backend=self.backend)
 
     def __iter__(self):
         return iter(self.coordinates)
 
+    def __array__(self, dtype=None, copy=None):
+        """
+        NumPy copy of the coordinates: float64 for the float backend, an
+        object array of the exact values otherwise. The coordinates live in
+        a tuple, so ``copy=False`` cannot be honored and raises ValueError.
+
+        >>> import numpy as np
+        >>> np.asarray(Vector(1, 2, backend='float'))
+        array([1., 2.])
+        >>> np.asarray(Vector(1, '0.5'))
+        array([Decimal('1'), Decimal('0.5')], dtype=object)
+        """
+        import numpy as np
+        if copy is False:
+            raise ValueError('A Vector cannot be exported without a copy')
+        if dtype is None:
+            dtype = np.float64 if self.backend is FLOAT else object
+        return np.array(self.coordinates, dtype=dtype)
+
     def __getitem__(self, item):
         return self.coordinates[item]
 
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3.6
+# -*- coding: utf-8 -*-
+from typing import Iterable, Iterator, List, Tuple, Union
+
+import numpy as np
+
+from vector import Vector
+
+
+class VectorArray:
+    """
+    N vectors of the same dimension stored in one contiguous float64 block.
+
+    Operations mirror the ones of ``Vector`` but are applied to every row
+    at once. The right operand may be another ``VectorArray`` of the same
+    shape or a single ``Vector``, which is broadcast over all rows.
+    """
+
+    def __init__(self, data):
+        self.data = np.ascontiguousarray(data, dtype=np.float64)
+
+        assert self.data.ndim == 2, 'VectorArray expects a 2D array'
+
+        self.dimension = self.data.shape[1]
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector],
+                     dimension: int = None) -> 'VectorArray':
+        """
+        >>> VectorArray.from_vectors([Vector(1, 2), Vector(3, 4)])
+        VectorArray(Vector(1.0, 2.0), Vector(3.0, 4.0))
+        >>> len(VectorArray.from_vectors([], dimension=3))
+        0
+        >>> VectorArray.from_vectors([Vector(1, 2), Vector(1, 2, 3)])
+        Traceback (most recent call last):
+        ...
+        AssertionError
+        """
+        rows = [tuple(v.coordinates) for v in vectors]
+
+        if not rows:
+            assert dimension is not None
+            return cls(np.empty((0, dimension)))
+
+        dimension = len(rows[0]) if dimension is None else dimension
+        assert all(len(row) == dimension for row in rows)
+
+        return cls(np.array(rows, dtype=np.float64))
+
+    @classmethod
+    def from_buffer(cls, buffer, dimension: int,
+                    offset: int = 0) -> 'VectorArray':
+        """
+        Wrap native float64 values of any buffer (bytes, array.array,
+        mmap, ...) without copying them.
+
+        >>> from array import array
+        >>> values = array('d', [1, 2, 3, 4])
+        >>> a = VectorArray.from_buffer(values, 2)
+        >>> values[0] = 10
+        >>> a
+        VectorArray(Vector(10.0, 2.0), Vector(3.0, 4.0))
+        """
+        data = np.frombuffer(buffer, dtype=np.float64, offset=offset)
+        return cls(data.reshape(-1, dimension))
+
+    def to_vectors(self) -> List[Vector]:
+        """
+        Rows as float backend vectors, so no binary value is expanded into
+        a long Decimal.
+
+        >>> VectorArray([[1, 2], [0.1, 4]]).to_vectors()
+        [Vector(1.0, 2.0), Vector(0.1, 4.0)]
+        """
+        return list(self)
+
+    @property
+    def magnitude(self) -> np.ndarray:
+        """
+        >>> VectorArray([[3, 4], [5, 12]]).magnitude
+        array([ 5., 13.])
+        """
+        return np.sqrt(np.einsum('ij,ij->i', self.data, self.data))
+
+    def get_unit_vector(self) -> 'VectorArray':
+        """
+        >>> VectorArray([[3, 4], [0, 0]]).get_unit_vector()
+        VectorArray(Vector(0.6, 0.8), Vector(0.0, 0.0))
+        """
+        magnitude = self.magnitude
+        # Zero vectors stay zero, exactly like ``Vector.get_unit_vector``
+        safe = np.where(magnitude == 0, 1, magnitude)
+        return VectorArray(self.data / safe[:, None])
+
+    def angle_to(self, other: Union['VectorArray', Vector]) -> np.ndarray:
+        """
+        >>> a = VectorArray([[0, 1], [2, 4]])
+        >>> a.angle_to(Vector(1, 0)).round(4)
+        array([1.5708, 1.1071])
+        >>> a.angle_to(VectorArray([[0, 2], [4, 8]])).round(4)
+        array([0., 0.])
+        """
+        other = self._coerce(other)
+        product = self.get_unit_vector() * other.get_unit_vector()
+        return np.arccos(np.clip(product, -1, 1))
+
+    def cross_product(self,
+                      other: Union['VectorArray', Vector]) -> 'VectorArray':
+        """
+        >>> VectorArray([[2, 0, 0], [0, 2, 0]]).cross_product(Vector(0, 2, 0))
+        VectorArray(Vector(0.0, 0.0, 4.0), Vector(0.0, 0.0, 0.0))
+        """
+        other = self._coerce(other)
+        assert self.dimension == 3
+
+        return VectorArray(np.cross(self.data, other.data))
+
+    def project_on(self, other: Union['VectorArray', Vector]) \
+            -> Tuple['VectorArray', 'VectorArray']:
+        """
+        >>> VectorArray([[3, 4], [1, 1]]).project_on(Vector(3, 0))
+        (VectorArray(Vector(3.0, 0.0), Vector(1.0, 0.0)), \
+VectorArray(Vector(0.0, 4.0), Vector(0.0, 1.0)))
+        """
+        other_unit_vector = self._coerce(other).get_unit_vector()
+
+        parallel_component = VectorArray(
+            other_unit_vector.data * (self * other_unit_vector)[:, None])
+
+        orthogonal_component = self - parallel_component
+
+        return parallel_component, orthogonal_component
+
+    def _coerce(self, other: Union['VectorArray', Vector]) -> 'VectorArray':
+        if isinstance(other, Vector):
+            other = VectorArray.from_vectors([other])
+
+        assert isinstance(other, VectorArray)
+        assert self.dimension == other.dimension
+        assert len(other) in (1, len(self))
+
+        return other
+
+    def __add__(self, other: Union['VectorArray', Vector]) -> 'VectorArray':
+        """
+        >>> VectorArray([[1, 2], [4, 5]]) + Vector(1, 1)
+        VectorArray(Vector(2.0, 3.0), Vector(5.0, 6.0))
+        >>> VectorArray([[1, 2]]) + Vector(1, 2, 3)
+        Traceback (most recent call last):
+        ...
+        AssertionError
+        """
+        return VectorArray(self.data + self._coerce(other).data)
+
+    def __sub__(self, other: Union['VectorArray', Vector]) -> 'VectorArray':
+        """
+        >>> VectorArray([[1, 2], [4, 5]]) - VectorArray([[2, 3], [-4, -5]])
+        VectorArray(Vector(-1.0, -1.0), Vector(8.0, 10.0))
+        """
+        return VectorArray(self.data - self._coerce(other).data)
+
+    def __mul__(self, other) -> Union['VectorArray', np.ndarray]:
+        """
+        >>> VectorArray([[1, 2, 3]]) * 2
+        VectorArray(Vector(2.0, 4.0, 6.0))
+        >>> VectorArray([[1, 2], [3, 4]]) * Vector(1, 2)
+        array([ 5., 11.])
+        """
+        if isinstance(other, (VectorArray, Vector)):
+            other = self._coerce(other)
+            return np.einsum('ij,ij->i', self.data, other.data) \
+                if len(other) == len(self) else self.data @ other.data[0]
+
+        return VectorArray(self.data * float(other))
+
+    def __rmul__(self, other) -> 'VectorArray':
+        """
+        >>> 5 * VectorArray([[1, 1]])
+        VectorArray(Vector(5.0, 5.0))
+        """
+        return self.__mul__(other)
+
+    def __truediv__(self, other) -> 'VectorArray':
+        """
+        >>> VectorArray([[4, 5]]) / 2
+        VectorArray(Vector(2.0, 2.5))
+        """
+        return VectorArray(self.data / float(other))
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        >>> a = VectorArray([[1, 2], [3, 4]])
+        >>> np.shares_memory(np.asarray(a), a.data)
+        True
+        """
+        if dtype is not None and np.dtype(dtype) != self.data.dtype:
+            return self.data.astype(dtype)
+        return self.data.copy() if copy else self.data
+
+    @property
+    def __array_interface__(self) -> dict:
+        return self.data.__array_interface__
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    def __iter__(self) -> Iterator[Vector]:
+        for row in self.data:
+            yield Vector(*row.tolist(), backend='float')
+
+    def __getitem__(self, item) -> Union['VectorArray', Vector]:
+        """
+        >>> a = VectorArray([[1, 2], [3, 4], [5, 6]])
+        >>> a[1]
+        Vector(3.0, 4.0)
+        >>> a[1:]
+        VectorArray(Vector(3.0, 4.0), Vector(5.0, 6.0))
+        """
+        if isinstance(item, slice):
+            return VectorArray(self.data[item])
+        return Vector(*self.data[item].tolist(), backend='float')
+
+    def __str__(self):
+        rows = ', '.join(
+            'Vector({})'.format(', '.join(str(x) for x in row))
+            for row in self.data.tolist())
+        return f"{self.__class__.__name__}({rows})"
+
+    __repr__ = __str__